@@ -122,9 +122,11 @@ class GtsEntity:
 
         # Calculate IDs if config provided
         if cfg is not None:
-            idv = self._calc_json_entity_id(cfg)
+            # Both IDs start from the same entity_id_fields lookup
+            entity_id_cand = self._first_non_empty_field(cfg.entity_id_fields)
+            idv = self._calc_json_entity_id(entity_id_cand)
             self.raw_id = idv  # Store raw ID even if non-GTS
-            self.schemaId = self._calc_json_schema_id(cfg)
+            self.schemaId = self._calc_json_schema_id(cfg, entity_id_cand)
             # If no valid GTS ID found in entity fields, use schema ID as fallback
             if not (idv and GtsID.is_valid(idv)):
                 if self.schemaId and GtsID.is_valid(self.schemaId):
@@ -302,8 +304,11 @@ class GtsEntity:
                 return f, v
         return None
 
-    def _calc_json_entity_id(self, cfg: GtsConfig) -> str:
-        cand = self._first_non_empty_field(cfg.entity_id_fields)
+    def _calc_json_entity_id(self, cand: Optional[Tuple[str, str]]) -> str:
+        """Entity ID from the first non-empty entity_id_fields value (cand).
+
+        Falls back to the file path (plus list index) when there is none.
+        """
         if cand:
             self.selected_entity_field = cand[0]
             return cand[1]
@@ -311,9 +316,14 @@ class GtsEntity:
             return f"{self.file.path}#{self.list_sequence}"
         return self.file.path if self.file else ""
 
-    def _calc_json_schema_id(self, cfg: GtsConfig) -> Optional[str]:
+    def _calc_json_schema_id(
+        self, cfg: GtsConfig, entity_id_cand: Optional[Tuple[str, str]]
+    ) -> Optional[str]:
         """Calculate schema_id based on entity type and content.
 
+        ``entity_id_cand`` is the first non-empty entity_id_fields value, as
+        already looked up for the entity ID.
+
         Rules:
         - For schemas: extract parent from $id chain, or fallback to $schema
         - For instances: look for type/schema fields in schema_id_fields
@@ -352,7 +362,6 @@ class GtsEntity:
         # PRIORITY 1: Check entity_id_fields for a GTS ID (gtsId, id, etc.)
         # If found and it's a chained ID, extract schema from the chain
         # NOTE: Skip $id field for instances - $id should only influence schema_id for schemas
-        entity_id_cand = self._first_non_empty_field(cfg.entity_id_fields)
         if entity_id_cand and GtsID.is_valid(entity_id_cand[1]):
             # Skip $id for non-schemas: $id without $schema means the doc is an instance
             # and $id should not be used to derive schema_id
@@ -11,6 +11,11 @@ from .entities import GtsEntity, GtsFile, DEFAULT_GTS_CONFIG, GtsConfig
 
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 
 EXCLUDE_LIST = ["node_modules", "dist", "build"]
 
@@ -18,6 +23,9 @@ EXCLUDE_LIST = ["node_modules", "dist", "build"]
 class GtsFileReader(GtsReader):
     """Reads GTS entities from JSON and YAML files in directories specified by path."""
 
+    # No random access by ID: everything comes from iterating the files
+    exhaustive = True
+
     def __init__(self, path: str | List[str], cfg: Optional[GtsConfig] = None) -> None:
         """
         Initialize FileReader with one or more paths.
@@ -76,11 +84,17 @@ class GtsFileReader(GtsReader):
 
     def _load_file(self, file_path: Path) -> Any:
         """Load content from JSON or YAML file."""
-        with file_path.open("r", encoding="utf-8") as f:
-            if file_path.suffix.lower() in {".yaml", ".yml"}:
+        if file_path.suffix.lower() in {".yaml", ".yml"}:
+            with file_path.open("r", encoding="utf-8") as f:
                 return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        data = file_path.read_bytes()
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # e.g. NaN or integers beyond 64 bits, which json accepts
+                pass
+        return json.loads(data.decode("utf-8"))
 
     def _process_file(self, file_path: Path) -> List[GtsEntity]:
         """Process a single JSON or YAML file and return list of GtsEntity objects."""
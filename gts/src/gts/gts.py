@@ -3,12 +3,36 @@ from __future__ import annotations
 import re
 import shlex
 import uuid
-from typing import List, Optional, Tuple, Dict, Any
+from sys import intern
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Dict, Any
 
 GTS_PREFIX = "gts."
 GTS_URI_PREFIX = "gts://"
 GTS_NS = uuid.uuid5(uuid.NAMESPACE_URL, "gts")
+_GTS_PREFIX_LEN = len(GTS_PREFIX)
+_GTS_URI_PREFIX_LEN = len(GTS_URI_PREFIX)
+# Accepted ID starts, with and without the URI prefix, for one startswith()
+_GTS_ID_STARTS = (GTS_PREFIX, GTS_URI_PREFIX + GTS_PREFIX)
 GTS_SEGMENT_TOKEN_REGEX = re.compile(r"^[a-z_][a-z0-9_]*$")
+# Canonical version number: ASCII digits without sign or leading zeros
+_VERSION_NUMBER_REGEX = re.compile(r"(?:0|[1-9][0-9]*)\Z")
+# A complete segment without '~': four tokens, major and optional minor version
+_SEGMENT_REGEX = re.compile(
+    r"([a-z_][a-z0-9_]*)\.([a-z_][a-z0-9_]*)\.([a-z_][a-z0-9_]*)\.([a-z_][a-z0-9_]*)"
+    r"\.v(0|[1-9][0-9]*)(?:\.(0|[1-9][0-9]*))?\Z"
+)
+
+
+def _version_number_cause(number: str, label: str) -> str:
+    """Explain why a version number token isn't canonical."""
+    try:
+        value = int(number)
+    except ValueError:
+        return f"{label} version must be an integer"
+    if value < 0:
+        return f"{label} version must be >= 0"
+    return f"{label} version must be an integer"
 
 
 class GtsInvalidSegment(ValueError):
@@ -56,7 +80,23 @@ class GtsIdSegment:
     The original string is stored in `segment`.
     """
 
-    def __init__(self, num: int, offset: int, segment: str):
+    # Parsed IDs are cached and can be numerous; slots avoid a per-segment
+    # attribute __dict__
+    __slots__ = (
+        "num",
+        "offset",
+        "segment",
+        "vendor",
+        "package",
+        "namespace",
+        "type",
+        "ver_major",
+        "ver_minor",
+        "is_type",
+        "is_wildcard",
+    )
+
+    def __init__(self, num: int, offset: int, segment: str) -> None:
         self.num: int = num
         self.offset: int = offset
         self.segment: str = segment.strip()
@@ -72,9 +112,10 @@ class GtsIdSegment:
 
         self._parse_segment_id(num, offset, segment)
 
-    def _parse_segment_id(self, num: int, offset: int, segment: str):
-        if segment.count("~") > 0:
-            if segment.count("~") > 1:
+    def _parse_segment_id(self, num: int, offset: int, segment: str) -> None:
+        tildes = segment.count("~")
+        if tildes > 0:
+            if tildes > 1:
                 raise GtsInvalidSegment(num, offset, segment, "Too many '~' characters")
             if segment.endswith("~"):
                 self.is_type = True
@@ -82,6 +123,22 @@ class GtsIdSegment:
             else:
                 raise GtsInvalidSegment(num, offset, segment, " '~' must be at the end")
 
+        # Well-formed, non-wildcard segments are parsed by one regex scan;
+        # anything else takes the token-by-token path for its error message
+        m = _SEGMENT_REGEX.match(segment)
+        if m is not None:
+            vendor, package, namespace, type_, major, minor = m.groups()
+            # Name tokens repeat across IDs; interned copies are shared and
+            # compare by identity first in segment matching
+            self.vendor = intern(vendor)
+            self.package = intern(package)
+            self.namespace = intern(namespace)
+            self.type = intern(type_)
+            self.ver_major = int(major)
+            if minor is not None:
+                self.ver_minor = int(minor)
+            return
+
         tokens = segment.split(".")
 
         if len(tokens) > 6:
@@ -101,25 +158,25 @@ class GtsIdSegment:
             if tokens[0] == "*":
                 self.is_wildcard = True
                 return
-            self.vendor = tokens[0]
+            self.vendor = intern(tokens[0])
 
         if len(tokens) > 1:
             if tokens[1] == "*":
                 self.is_wildcard = True
                 return
-            self.package = tokens[1]
+            self.package = intern(tokens[1])
 
         if len(tokens) > 2:
             if tokens[2] == "*":
                 self.is_wildcard = True
                 return
-            self.namespace = tokens[2]
+            self.namespace = intern(tokens[2])
 
         if len(tokens) > 3:
             if tokens[3] == "*":
                 self.is_wildcard = True
                 return
-            self.type = tokens[3]
+            self.type = intern(tokens[3])
 
         if len(tokens) > 4:
             if tokens[4] == "*":
@@ -130,69 +187,124 @@ class GtsIdSegment:
                 raise GtsInvalidSegment(
                     num, offset, segment, "Major version must start with 'v'"
                 )
-            try:
-                self.ver_major = int(tokens[4][1:])
-            except ValueError:
-                raise GtsInvalidSegment(
-                    num, offset, segment, "Major version must be an integer"
-                )
-
-            if self.ver_major < 0:
-                raise GtsInvalidSegment(
-                    num, offset, segment, "Major version must be >= 0"
-                )
-            if str(self.ver_major) != tokens[4][1:]:
+            major = tokens[4][1:]
+            if not _VERSION_NUMBER_REGEX.match(major):
                 raise GtsInvalidSegment(
-                    num, offset, segment, "Major version must be an integer"
+                    num, offset, segment, _version_number_cause(major, "Major")
                 )
+            self.ver_major = int(major)
 
         if len(tokens) > 5:
             if tokens[5] == "*":
                 self.is_wildcard = True
                 return
 
-            try:
-                self.ver_minor = int(tokens[5])
-            except ValueError:
+            if not _VERSION_NUMBER_REGEX.match(tokens[5]):
                 raise GtsInvalidSegment(
-                    num, offset, segment, "Minor version must be an integer"
+                    num, offset, segment, _version_number_cause(tokens[5], "Minor")
                 )
+            self.ver_minor = int(tokens[5])
 
-            if self.ver_minor < 0:
-                raise GtsInvalidSegment(
-                    num, offset, segment, "Minor version must be >= 0"
-                )
-            if str(self.ver_minor) != tokens[5]:
-                raise GtsInvalidSegment(
-                    num, offset, segment, "Minor version must be an integer"
-                )
 
+def _match_segments(
+    pattern_segs: Sequence[GtsIdSegment], candidate_segs: Sequence[GtsIdSegment]
+) -> bool:
+    """Match parsed candidate segments against pattern segments, with version flexibility."""
+    # If pattern is longer than candidate, no match
+    if len(pattern_segs) > len(candidate_segs):
+        return False
 
-class GtsID:
-    def __init__(self, id: str):
-        raw = id.strip()
+    for i, p_seg in enumerate(pattern_segs):
+        c_seg = candidate_segs[i]
 
-        # Strip gts:// URI prefix if present
-        if raw.startswith(GTS_URI_PREFIX):
-            raw = raw[len(GTS_URI_PREFIX) :]
+        # If pattern segment is a wildcard, check non-wildcard fields first
+        if p_seg.is_wildcard:
+            # Check the fields that are set (non-empty) in the wildcard pattern
+            if p_seg.vendor and p_seg.vendor != c_seg.vendor:
+                return False
+            if p_seg.package and p_seg.package != c_seg.package:
+                return False
+            if p_seg.namespace and p_seg.namespace != c_seg.namespace:
+                return False
+            if p_seg.type and p_seg.type != c_seg.type:
+                return False
+            # Check version fields if they are set in the pattern
+            if p_seg.ver_major != 0 and p_seg.ver_major != c_seg.ver_major:
+                return False
+            if p_seg.ver_minor is not None and p_seg.ver_minor != c_seg.ver_minor:
+                return False
+            # Check is_type flag if set
+            if p_seg.is_type and p_seg.is_type != c_seg.is_type:
+                return False
+            # Wildcard matches - accept anything after this point
+            return True
+
+        # Non-wildcard segment - all fields must match exactly
+        # Check vendor, package, namespace, type match
+        if p_seg.vendor != c_seg.vendor:
+            return False
+        if p_seg.package != c_seg.package:
+            return False
+        if p_seg.namespace != c_seg.namespace:
+            return False
+        if p_seg.type != c_seg.type:
+            return False
 
-        # Validate it's lower case
-        if raw != raw.lower():
-            raise GtsInvalidId(id, "Must be lower case")
+        # Check version matching
+        # Major version must match
+        if p_seg.ver_major != c_seg.ver_major:
+            return False
 
-        if "-" in raw:
-            raise GtsInvalidId(id, "Must not contain '-'")
+        # Minor version: if pattern has no minor version, accept any minor in candidate
+        # If pattern has minor version, it must match exactly
+        if p_seg.ver_minor is not None:
+            if p_seg.ver_minor != c_seg.ver_minor:
+                return False
+        # else: pattern has no minor version, so any minor version in candidate is OK
 
-        if not raw.startswith(GTS_PREFIX):
-            raise GtsInvalidId(id, f"Does not start with '{GTS_PREFIX}'")
-        if len(raw) > 1024:
-            raise GtsInvalidId(id, "Too long")
+        # Check is_type flag matches
+        if p_seg.is_type != c_seg.is_type:
+            return False
+
+    # If we've matched all pattern segments, it's a match
+    return True
 
-        self.id: str = raw
-        self.gts_id_segments: List[GtsIdSegment] = []
 
+@lru_cache(maxsize=4096)
+def _parse_gts_id(id: str) -> Tuple[str, Tuple[GtsIdSegment, ...]]:
+    """Validate and split a GTS ID into (normalized id, segments).
+
+    Cached per input string, so the returned segments are shared between
+    GtsID instances and must not be mutated. Invalid IDs raise and are not
+    cached.
+    """
+    raw = id.strip()
+
+    # Strip gts:// URI prefix if present
+    if raw.startswith(GTS_URI_PREFIX):
+        raw = raw[_GTS_URI_PREFIX_LEN:]
+
+    # Validate it's lower case
+    if raw != raw.lower():
+        raise GtsInvalidId(id, "Must be lower case")
+
+    if "-" in raw:
+        raise GtsInvalidId(id, "Must not contain '-'")
+
+    if not raw.startswith(GTS_PREFIX):
+        raise GtsInvalidId(id, f"Does not start with '{GTS_PREFIX}'")
+    if len(raw) > 1024:
+        raise GtsInvalidId(id, "Too long")
+
+    segments: List[GtsIdSegment] = []
+
+    body = raw[_GTS_PREFIX_LEN:]
+    if "~" not in body[:-1]:
+        # Single segment ('~' at most at the end): nothing to split
+        parts = [body]
+    else:
         # split preserving empties to detect trailing '~'
-        _parts = raw[len(GTS_PREFIX) :].split("~")
+        _parts = body.split("~")
         parts = []
         for i in range(0, len(_parts)):
             if i < len(_parts) - 1:
@@ -202,26 +314,49 @@ class GtsID:
             else:
                 parts.append(_parts[i])
 
-        offset = len(GTS_PREFIX)
-        for i in range(0, len(parts)):
-            if parts[i] == "":
-                raise GtsInvalidId(
-                    id, f"GTS segment #{i + 1} @ offset {offset} is empty"
-                )
+    offset = _GTS_PREFIX_LEN
+    for i in range(0, len(parts)):
+        if parts[i] == "":
+            raise GtsInvalidId(id, f"GTS segment #{i + 1} @ offset {offset} is empty")
+
+        segments.append(GtsIdSegment(i + 1, offset, parts[i]))
+        offset += len(parts[i])
+
+    # Issue #37: Single-segment instance IDs are not allowed
+    # An instance ID (not ending with ~) must be chained (have at least 2 segments)
+    if not raw.endswith("~") and len(segments) == 1:
+        # Check if it's a wildcard (wildcards are allowed as single segment)
+        if not any(seg.is_wildcard for seg in segments):
+            raise GtsInvalidId(
+                id,
+                "Single-segment instance IDs are not allowed. "
+                "Instance IDs must be chained (e.g., type~instance).",
+            )
+
+    return intern(raw), tuple(segments)
 
-            self.gts_id_segments.append(GtsIdSegment(i + 1, offset, parts[i]))
-            offset += len(parts[i])
-
-        # Issue #37: Single-segment instance IDs are not allowed
-        # An instance ID (not ending with ~) must be chained (have at least 2 segments)
-        if not self.id.endswith("~") and len(self.gts_id_segments) == 1:
-            # Check if it's a wildcard (wildcards are allowed as single segment)
-            if not any(seg.is_wildcard for seg in self.gts_id_segments):
-                raise GtsInvalidId(
-                    id,
-                    "Single-segment instance IDs are not allowed. "
-                    "Instance IDs must be chained (e.g., type~instance).",
-                )
+
+@lru_cache(maxsize=4096)
+def _id_uuid(id: str) -> uuid.UUID:
+    """UUIDv5 of a normalized GTS ID; cached since IDs repeat across GtsID instances."""
+    return uuid.uuid5(GTS_NS, id)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid(cls: type, s: str) -> bool:
+    """Whether cls(s) parses; cached so repeated invalid inputs don't raise again."""
+    try:
+        cls(s)
+        return True
+    except Exception:
+        return False
+
+
+class GtsID:
+    def __init__(self, id: str) -> None:
+        raw, segments = _parse_gts_id(id)
+        self.id: str = raw
+        self.gts_id_segments: Tuple[GtsIdSegment, ...] = segments
 
     @property
     def is_type(self) -> bool:
@@ -233,102 +368,33 @@ class GtsID:
         return GTS_PREFIX + "".join([s.segment for s in self.gts_id_segments[:-1]])
 
     def to_uuid(self) -> uuid.UUID:
-        return uuid.uuid5(GTS_NS, self.id)
+        return _id_uuid(self.id)
 
     @classmethod
     def is_valid(cls, s: str) -> bool:
-        # Strip gts:// URI prefix if present
-        normalized = s
-        if normalized.startswith(GTS_URI_PREFIX):
-            normalized = normalized[len(GTS_URI_PREFIX) :]
-        if not normalized.startswith(GTS_PREFIX):
-            return False
-        try:
-            _ = cls(s)
-            return True
-        except Exception:
+        # 'gts.' with or without the gts:// URI prefix
+        if not s.startswith(_GTS_ID_STARTS):
             return False
+        return _is_valid(cls, s)
 
     def wildcard_match(self, pattern: GtsWildcard) -> bool:
-        p = pattern.id
-
-        # Helper function to match segments with version flexibility
-        def match_segments(
-            pattern_segs: List[GtsIdSegment], candidate_segs: List[GtsIdSegment]
-        ) -> bool:
-            # If pattern is longer than candidate, no match
-            if len(pattern_segs) > len(candidate_segs):
-                return False
+        prefix = getattr(pattern, "prefix", None)
+        if prefix is not None:
+            return self.id.startswith(prefix)
 
-            for i, p_seg in enumerate(pattern_segs):
-                c_seg = candidate_segs[i]
-
-                # If pattern segment is a wildcard, check non-wildcard fields first
-                if p_seg.is_wildcard:
-                    # Check the fields that are set (non-empty) in the wildcard pattern
-                    if p_seg.vendor and p_seg.vendor != c_seg.vendor:
-                        return False
-                    if p_seg.package and p_seg.package != c_seg.package:
-                        return False
-                    if p_seg.namespace and p_seg.namespace != c_seg.namespace:
-                        return False
-                    if p_seg.type and p_seg.type != c_seg.type:
-                        return False
-                    # Check version fields if they are set in the pattern
-                    if p_seg.ver_major != 0 and p_seg.ver_major != c_seg.ver_major:
-                        return False
-                    if (
-                        p_seg.ver_minor is not None
-                        and p_seg.ver_minor != c_seg.ver_minor
-                    ):
-                        return False
-                    # Check is_type flag if set
-                    if p_seg.is_type and p_seg.is_type != c_seg.is_type:
-                        return False
-                    # Wildcard matches - accept anything after this point
-                    return True
-
-                # Non-wildcard segment - all fields must match exactly
-                # Check vendor, package, namespace, type match
-                if p_seg.vendor != c_seg.vendor:
-                    return False
-                if p_seg.package != c_seg.package:
-                    return False
-                if p_seg.namespace != c_seg.namespace:
-                    return False
-                if p_seg.type != c_seg.type:
-                    return False
-
-                # Check version matching
-                # Major version must match
-                if p_seg.ver_major != c_seg.ver_major:
-                    return False
-
-                # Minor version: if pattern has no minor version, accept any minor in candidate
-                # If pattern has minor version, it must match exactly
-                if p_seg.ver_minor is not None:
-                    if p_seg.ver_minor != c_seg.ver_minor:
-                        return False
-                # else: pattern has no minor version, so any minor version in candidate is OK
-
-                # Check is_type flag matches
-                if p_seg.is_type != c_seg.is_type:
-                    return False
-
-            # If we've matched all pattern segments, it's a match
-            return True
+        p = pattern.id
 
         # No wildcard case - need exact match with version flexibility
         if "*" not in p:
             # Parse both as segments and compare
-            return match_segments(pattern.gts_id_segments, self.gts_id_segments)
+            return _match_segments(pattern.gts_id_segments, self.gts_id_segments)
 
         # Wildcard case
         if p.count("*") > 1 or not p.endswith("*"):
             return False
 
         # Use segment matching for wildcard patterns too
-        return match_segments(pattern.gts_id_segments, self.gts_id_segments)
+        return _match_segments(pattern.gts_id_segments, self.gts_id_segments)
 
     def parse_query(self, expr: str) -> Tuple[str, Dict[str, str]]:
         base, _, filt = expr.partition("[")
@@ -357,16 +423,16 @@ class GtsID:
 
     @classmethod
     def split_at_path(cls, gts_with_path: str) -> Tuple[str, Optional[str]]:
-        if "@" not in gts_with_path:
+        gts, sep, path = gts_with_path.partition("@")
+        if not sep:
             return gts_with_path, None
-        gts, path = gts_with_path.split("@", 1)
         if not path:
             raise ValueError("Attribute path cannot be empty")
         return gts, path
 
 
 class GtsWildcard(GtsID):
-    def __init__(self, pattern: str):
+    def __init__(self, pattern: str) -> None:
         p = pattern.strip()
         if not p.startswith(GTS_PREFIX):
             raise GtsInvalidWildcard(pattern, f"Does not start with '{GTS_PREFIX}'")
@@ -383,3 +449,27 @@ class GtsWildcard(GtsID):
             super().__init__(p)
         except GtsInvalidId as e:
             raise GtsInvalidWildcard(pattern, str(e))
+
+        # A single-segment pattern whose '*' follows only name tokens
+        # (vendor..type) matches exactly the IDs starting with the text before
+        # '*'. Version tokens keep segment matching for its version rules.
+        self.prefix: Optional[str] = None
+        if len(self.gts_id_segments) == 1 and self.id.endswith(".*"):
+            head = self.id[_GTS_PREFIX_LEN:-1]
+            tokens = head[:-1].split(".") if head else []
+            if len(tokens) <= 4 and all(tokens):
+                self.prefix = self.id[:-1]
+
+    def match_segments(self, candidate_segs: Sequence[GtsIdSegment]) -> bool:
+        """Match already-parsed candidate segments (e.g. GtsID.gts_id_segments).
+
+        Equivalent to GtsID.wildcard_match(self) for the candidate, without
+        re-checking the pattern string.
+        """
+        return _match_segments(self.gts_id_segments, candidate_segs)
+
+    def match(self, candidate: GtsID) -> bool:
+        """Match a parsed GTS ID; same result as candidate.wildcard_match(self)."""
+        if self.prefix is not None:
+            return candidate.id.startswith(self.prefix)
+        return _match_segments(self.gts_id_segments, candidate.gts_id_segments)
@@ -1,7 +1,31 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Path tokens between dots: "[...]" groups, an unclosed "[" with the rest of
+# its dot-separated part, or plain key text
+_PATH_TOKEN_RE = re.compile(r"\[[^\].]*\]|\[[^.]*|[^\[.]+")
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[Tuple[str, bool, Optional[int]], ...]:
+    """Parse a path once into (token, is_bracketed, list_index) steps.
+
+    list_index is the token (or its bracket contents) as an int, or None when
+    it isn't one; tokens are kept for error messages.
+    """
+    steps = []
+    for tok in _PATH_TOKEN_RE.findall(path.replace("/", ".")):
+        bracketed = tok.startswith("[") and tok.endswith("]")
+        try:
+            idx: Optional[int] = int(tok[1:-1] if bracketed else tok)
+        except ValueError:
+            idx = None
+        steps.append((tok, bracketed, idx))
+    return tuple(steps)
 
 
 @dataclass
@@ -14,43 +38,6 @@ class GtsPathResolver:
     error: str | None = None
     available_fields: List[str] = None  # type: ignore
 
-    def _normalize(self, path: str) -> str:
-        return path.replace("/", ".")
-
-    def _split_raw_parts(self, norm: str) -> List[str]:
-        return [seg for seg in norm.split(".") if seg != ""]
-
-    def _parse_part(self, seg: str) -> List[str]:
-        out: List[str] = []
-        buf = ""
-        i = 0
-        while i < len(seg):
-            ch = seg[i]
-            if ch == "[":
-                if buf:
-                    out.append(buf)
-                    buf = ""
-                j = seg.find("]", i + 1)
-                if j == -1:
-                    buf += seg[i:]
-                    break
-                out.append(seg[i : j + 1])
-                i = j + 1
-            else:
-                buf += ch
-                i += 1
-        if buf:
-            out.append(buf)
-        return out
-
-    def _parts(self, path: str) -> List[str]:
-        norm = self._normalize(path)
-        raw = self._split_raw_parts(norm)
-        parts: List[str] = []
-        for seg in raw:
-            parts.extend(self._parse_part(seg))
-        return parts
-
     def _list_available(self, node: Any, prefix: str, out: List[str]) -> None:
         if isinstance(node, dict):
             for k, v in node.items():
@@ -77,45 +64,28 @@ class GtsPathResolver:
         self.error = None
         self.available_fields = []
 
-        parts = self._parts(path)
         cur: Any = self.content
-        for p in parts:
-            if isinstance(cur, list):
-                if p.startswith("[") and p.endswith("]"):
-                    idx_str = p[1:-1]
-                    try:
-                        idx = int(idx_str)
-                    except ValueError:
-                        self.error = f"Expected list index at segment '{p}'"
-                        self.available_fields = self._collect_from(cur)
-                        return self
-                else:
-                    try:
-                        idx = int(p)
-                    except ValueError:
-                        self.error = f"Expected list index at segment '{p}'"
-                        self.available_fields = self._collect_from(cur)
-                        return self
-                if idx < 0 or idx >= len(cur):
-                    self.error = f"Index out of range at segment '{p}'"
+        for p, bracketed, idx in _compile_path(path):
+            # Exact-type checks first; isinstance only for subclasses
+            t = type(cur)
+            if t is dict or (t is not list and isinstance(cur, dict)):
+                if bracketed or p not in cur:
+                    self.error = f"Path not found at segment '{p}' in '{path}', see available fields"
                     self.available_fields = self._collect_from(cur)
                     return self
-                cur = cur[idx]
-            elif isinstance(cur, dict):
-                if p.startswith("[") and p.endswith("]"):
-                    self.error = f"Path not found at segment '{p}' in '{path}', see available fields"
+                cur = cur[p]
+            elif t is list or isinstance(cur, list):
+                if idx is None:
+                    self.error = f"Expected list index at segment '{p}'"
                     self.available_fields = self._collect_from(cur)
                     return self
-                if p not in cur:
-                    self.error = f"Path not found at segment '{p}' in '{path}', see available fields"
+                if idx < 0 or idx >= len(cur):
+                    self.error = f"Index out of range at segment '{p}'"
                     self.available_fields = self._collect_from(cur)
                     return self
-                cur = cur[p]
+                cur = cur[idx]
             else:
                 self.error = f"Cannot descend into {type(cur)} at segment '{p}'"
-                self.available_fields = (
-                    self._collect_from(cur) if isinstance(cur, (dict, list)) else []
-                )
                 return self
         self.value = cur
         self.resolved = True
@@ -129,7 +99,20 @@ class GtsPathResolver:
         self.available_fields = []
         return self
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> Dict[str, Any]:
+        error = self.error
+        available_fields = self.available_fields
+        # Usual failure shape built as one literal instead of grown key by key
+        if error and available_fields:
+            return {
+                "gts_id": self.gts_id,
+                "path": self.path,
+                "value": self.value,
+                "resolved": self.resolved,
+                "error": error,
+                "available_fields": available_fields,
+            }
+
         ret = {
             "gts_id": self.gts_id,
             "path": self.path,
@@ -137,9 +120,9 @@ class GtsPathResolver:
             "resolved": self.resolved,
         }
 
-        if self.error:
-            ret["error"] = self.error
-        if self.available_fields:
-            ret["available_fields"] = self.available_fields
+        if error:
+            ret["error"] = error
+        if available_fields:
+            ret["available_fields"] = available_fields
 
         return ret
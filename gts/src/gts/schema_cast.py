@@ -1,14 +1,107 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import copy
-from jsonschema import validate as js_validate
+import hashlib
+import json
+import math
 from jsonschema import exceptions as js_exceptions
+from jsonschema.validators import validator_for
+from referencing import Registry
 
 from .gts import GtsID
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+
+# Validators for target schemas (with GTS const constraints relaxed), keyed by
+# a content hash so schemas reloaded from JSON still hit the cache. Values are
+# (validator class, modified schema, validator instance without resolver).
+_VALIDATOR_CACHE_MAX = 256
+_validator_cache: Dict[bytes, Tuple[Any, Dict[str, Any], Any]] = {}
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached target schema validators."""
+    _validator_cache.clear()
+
+
+def _canonical_bytes(obj: Any) -> bytes:
+    """Serialize JSON data with sorted keys, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _is_plain_json(obj: Any, depth: int = 0) -> bool:
+    """True if obj is built only of exact JSON types that round-trip unchanged.
+
+    Rejects subclasses, tuples, non-str keys, non-finite floats and anything
+    nested deeper than orjson allows (which also stops on cyclic data).
+    """
+    if depth > 254:
+        return False
+    t = type(obj)
+    if t is str or t is bool or t is int or obj is None:
+        return True
+    if t is float:
+        return math.isfinite(obj)
+    if t is dict:
+        return all(
+            type(k) is str and _is_plain_json(v, depth + 1) for k, v in obj.items()
+        )
+    if t is list:
+        return all(_is_plain_json(v, depth + 1) for v in obj)
+    return False
+
+
+def _fast_json_deepcopy(obj: Any) -> Any:
+    """Deep copy JSON data, via an orjson round-trip when it is installed.
+
+    The round-trip is only taken for plain JSON values (see _is_plain_json());
+    anything else, or anything orjson still rejects (e.g. ints wider than 64
+    bits), goes through copy.deepcopy() so types and values are preserved.
+    """
+    if orjson is not None and type(obj) in (dict, list) and _is_plain_json(obj):
+        try:
+            return orjson.loads(orjson.dumps(obj))
+        except TypeError:
+            pass
+    return copy.deepcopy(obj)
+
+
+def _schema_key(schema: Any) -> Optional[bytes]:
+    """Content hash of a schema, or None if it is not JSON-serializable."""
+    try:
+        return hashlib.blake2b(_canonical_bytes(schema), digest_size=16).digest()
+    except (TypeError, ValueError):
+        return None
+
+
+# Key order of GtsEntityCastResult.to_dict() ("old"/"new" mirror "from"/"to")
+_RESULT_KEYS = (
+    "from",
+    "to",
+    "old",
+    "new",
+    "direction",
+    "added_properties",
+    "removed_properties",
+    "changed_properties",
+    "is_fully_compatible",
+    "is_backward_compatible",
+    "is_forward_compatible",
+    "incompatibility_reasons",
+    "backward_errors",
+    "forward_errors",
+    "casted_entity",
+)
+
 
 class SchemaCastError(Exception):
     pass
@@ -19,55 +112,51 @@ class GtsEntityCastResult:
     from_id: str = ""
     to_id: str = ""
     direction: str = "unknown"
-    added_properties: List[str] = None  # type: ignore
-    removed_properties: List[str] = None  # type: ignore
-    changed_properties: List[Dict[str, str]] = None  # type: ignore
+    added_properties: List[str] = field(default_factory=list)
+    removed_properties: List[str] = field(default_factory=list)
+    changed_properties: List[Dict[str, str]] = field(default_factory=list)
     is_fully_compatible: bool = False
     is_backward_compatible: bool = False
     is_forward_compatible: bool = False
-    incompatibility_reasons: List[str] = None  # type: ignore
-    backward_errors: List[str] = None  # type: ignore
-    forward_errors: List[str] = None  # type: ignore
+    incompatibility_reasons: List[str] = field(default_factory=list)
+    backward_errors: List[str] = field(default_factory=list)
+    forward_errors: List[str] = field(default_factory=list)
     casted_entity: Optional[Dict[str, Any]] = None
     error: str = ""
 
-    def __post_init__(self):
-        # Initialize list fields if None
-        if self.added_properties is None:
-            self.added_properties = []
-        if self.removed_properties is None:
-            self.removed_properties = []
-        if self.changed_properties is None:
-            self.changed_properties = []
-        if self.incompatibility_reasons is None:
-            self.incompatibility_reasons = []
-        if self.backward_errors is None:
-            self.backward_errors = []
-        if self.forward_errors is None:
-            self.forward_errors = []
-
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "from": self.from_id,
-            "to": self.to_id,
-            "old": self.from_id,
-            "new": self.to_id,
-            "direction": self.direction,
-            "added_properties": self.added_properties,
-            "removed_properties": self.removed_properties,
-            "changed_properties": self.changed_properties,
-            "is_fully_compatible": self.is_fully_compatible,
-            "is_backward_compatible": self.is_backward_compatible,
-            "is_forward_compatible": self.is_forward_compatible,
-            "incompatibility_reasons": self.incompatibility_reasons,
-            "backward_errors": self.backward_errors,
-            "forward_errors": self.forward_errors,
-            "casted_entity": self.casted_entity,
-        }
+        result = dict(
+            zip(
+                _RESULT_KEYS,
+                (
+                    self.from_id,
+                    self.to_id,
+                    self.from_id,
+                    self.to_id,
+                    self.direction,
+                    self.added_properties,
+                    self.removed_properties,
+                    self.changed_properties,
+                    self.is_fully_compatible,
+                    self.is_backward_compatible,
+                    self.is_forward_compatible,
+                    self.incompatibility_reasons,
+                    self.backward_errors,
+                    self.forward_errors,
+                    self.casted_entity,
+                ),
+            )
+        )
         if self.error:
             result["error"] = self.error
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() as UTF-8 JSON, via orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
     @classmethod
     def cast(
         cls,
@@ -111,7 +200,7 @@ class GtsEntityCastResult:
         try:
             casted, added, removed, incompatibility_reasons = (
                 cls._cast_instance_to_schema(
-                    copy.deepcopy(from_instance_content)
+                    _fast_json_deepcopy(from_instance_content)
                     if isinstance(from_instance_content, dict)
                     else {},
                     target_schema,
@@ -195,6 +284,22 @@ class GtsEntityCastResult:
                     return part
         return s
 
+    @staticmethod
+    def _normalize_properties(schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a shallow copy of schema whose properties are all dicts.
+
+        Non-dict property subschemas (e.g. boolean schemas) are replaced by ``{}``
+        so the casting loops can read them without repeated type checks.
+        """
+        props = schema.get("properties")
+        result = dict(schema)
+        result["properties"] = (
+            {k: (v if isinstance(v, dict) else {}) for k, v in props.items()}
+            if isinstance(props, dict)
+            else {}
+        )
+        return result
+
     @staticmethod
     def _cast_instance_to_schema(
         instance: Dict[str, Any],
@@ -209,6 +314,9 @@ class GtsEntityCastResult:
         - Remove fields not in target schema when additionalProperties is false
         - Validate constraints via a final jsonschema validation step
         - Recursively handle nested objects (and arrays of objects)
+
+        Every value in ``schema["properties"]`` must be a dict; callers pass a
+        schema produced by ``_flatten_schema`` or ``_normalize_properties``.
         """
         added: List[str] = []
         removed: List[str] = []
@@ -217,11 +325,7 @@ class GtsEntityCastResult:
         if not isinstance(instance, dict):
             raise SchemaCastError("Instance must be an object for casting")
 
-        target_props = (
-            schema.get("properties", {})
-            if isinstance(schema.get("properties"), dict)
-            else {}
-        )
+        target_props = schema["properties"]
         required = (
             set(schema.get("required", []))
             if isinstance(schema.get("required"), list)
@@ -236,8 +340,8 @@ class GtsEntityCastResult:
         for prop in required:
             if prop not in result:
                 p_schema = target_props.get(prop, {})
-                if isinstance(p_schema, dict) and "default" in p_schema:
-                    result[prop] = copy.deepcopy(p_schema["default"])
+                if "default" in p_schema:
+                    result[prop] = _fast_json_deepcopy(p_schema["default"])
                     path = f"{base_path}.{prop}" if base_path else prop
                     added.append(path)
                 else:
@@ -251,19 +355,13 @@ class GtsEntityCastResult:
         for prop, p_schema in target_props.items():
             if prop in required:
                 continue
-            if (
-                prop not in result
-                and isinstance(p_schema, dict)
-                and "default" in p_schema
-            ):
-                result[prop] = copy.deepcopy(p_schema["default"])
+            if prop not in result and "default" in p_schema:
+                result[prop] = _fast_json_deepcopy(p_schema["default"])
                 path = f"{base_path}.{prop}" if base_path else prop
                 added.append(path)
 
         # 2.5) Update const values to match target schema (for GTS ID fields like type and id)
         for prop, p_schema in target_props.items():
-            if not isinstance(p_schema, dict):
-                continue
             if "const" in p_schema:
                 const_value = p_schema["const"]
                 # Update the value if it's a GTS ID or if the property exists
@@ -290,11 +388,11 @@ class GtsEntityCastResult:
             if prop not in result:
                 continue
             val = result[prop]
-            if not isinstance(p_schema, dict):
-                continue
             p_type = p_schema.get("type")
             if p_type == "object" and isinstance(val, dict):
-                nested_schema = GtsEntityCastResult._effective_object_schema(p_schema)
+                nested_schema = GtsEntityCastResult._normalize_properties(
+                    GtsEntityCastResult._effective_object_schema(p_schema)
+                )
                 new_obj, add_sub, rem_sub, new_incompatibility_reasons = (
                     GtsEntityCastResult._cast_instance_to_schema(
                         val,
@@ -313,8 +411,8 @@ class GtsEntityCastResult:
                     isinstance(items_schema, dict)
                     and items_schema.get("type") == "object"
                 ):
-                    nested_schema = GtsEntityCastResult._effective_object_schema(
-                        items_schema
+                    nested_schema = GtsEntityCastResult._normalize_properties(
+                        GtsEntityCastResult._effective_object_schema(items_schema)
                     )
                     new_list: List[Any] = []
                     for idx, item in enumerate(val):
@@ -347,14 +445,33 @@ class GtsEntityCastResult:
         schema: Dict[str, Any],
         resolver: Optional[Any] = None,
     ) -> None:
-        """Validate instance against schema, but allow const values to differ if both are GTS IDs."""
-        # Create a modified schema that removes const constraints for GTS IDs
-        modified_schema = GtsEntityCastResult._remove_gts_const_constraints(schema)
+        """Validate instance against schema, but allow const values to differ if both are GTS IDs.
 
-        if resolver is not None:
-            js_validate(instance=instance, schema=modified_schema, resolver=resolver)
-        else:
-            js_validate(instance=instance, schema=modified_schema)
+        Behaves like jsonschema.validate(), but the relaxed schema and its
+        checked validator are cached by schema content. ``resolver`` may be a
+        ``referencing.Registry`` or a legacy ``RefResolver``.
+        """
+        key = _schema_key(schema)
+        entry = _validator_cache.get(key) if key is not None else None
+        if entry is None:
+            # Create a modified schema that removes const constraints for GTS IDs
+            modified_schema = GtsEntityCastResult._remove_gts_const_constraints(schema)
+            validator_cls = validator_for(modified_schema)
+            validator_cls.check_schema(modified_schema)
+            entry = (validator_cls, modified_schema, validator_cls(modified_schema))
+            if key is not None:
+                if len(_validator_cache) >= _VALIDATOR_CACHE_MAX:
+                    _validator_cache.pop(next(iter(_validator_cache)))
+                _validator_cache[key] = entry
+
+        validator_cls, modified_schema, validator = entry
+        if isinstance(resolver, Registry):
+            validator = validator_cls(modified_schema, registry=resolver)
+        elif resolver is not None:
+            validator = validator_cls(modified_schema, resolver=resolver)
+        error = js_exceptions.best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
 
     @staticmethod
     def _remove_gts_const_constraints(schema: Any) -> Any:
@@ -408,6 +525,11 @@ class GtsEntityCastResult:
         if "additionalProperties" in schema:
             result["additionalProperties"] = schema["additionalProperties"]
 
+        # Invariant: every property subschema is a dict (non-dict schemas become {})
+        result["properties"] = {
+            k: (v if isinstance(v, dict) else {})
+            for k, v in result["properties"].items()
+        }
         return result
 
     @staticmethod
@@ -548,37 +670,66 @@ class GtsEntityCastResult:
             check_backward: If True, check backward compatibility (new consumers read old data).
                           If False, check forward compatibility (old consumers read new data).
 
+        Nested object properties are walked depth-first with an explicit stack
+        of (property iterator, old properties, new properties, prefix) frames,
+        so errors come out in the same order as a recursive walk. Errors found
+        below a property are prefixed with "Property '<name>': " per level.
+
         Returns:
             Tuple of (is_compatible, list_of_errors)
         """
+        if old_schema is new_schema:
+            return True, []
+
         errors: List[str] = []
+        stack: List[Tuple[Iterator[str], Dict[str, Any], Dict[str, Any], str]] = []
+        pending: Optional[Tuple[Dict[str, Any], Dict[str, Any], str]] = (
+            old_schema,
+            new_schema,
+            "",
+        )
 
-        # Flatten schemas to handle allOf
-        old_flat = GtsEntityCastResult._flatten_schema(old_schema)
-        new_flat = GtsEntityCastResult._flatten_schema(new_schema)
-
-        old_props = old_flat.get("properties", {})
-        new_props = new_flat.get("properties", {})
-        old_required = set(old_flat.get("required", []))
-        new_required = set(new_flat.get("required", []))
-
-        # Check required properties changes
-        if check_backward:
-            # Backward: cannot add required properties
-            newly_required = new_required - old_required
-            if newly_required:
-                errors.append(f"Added required properties: {', '.join(newly_required)}")
-        else:
-            # Forward: cannot remove required properties
-            removed_required = old_required - new_required
-            if removed_required:
-                errors.append(
-                    f"Removed required properties: {', '.join(removed_required)}"
-                )
+        while pending is not None or stack:
+            if pending is not None:
+                old_s, new_s, prefix = pending
+                pending = None
+
+                # Flatten schemas to handle allOf
+                old_flat = GtsEntityCastResult._flatten_schema(old_s)
+                new_flat = GtsEntityCastResult._flatten_schema(new_s)
+
+                old_props = old_flat.get("properties", {})
+                new_props = new_flat.get("properties", {})
+                old_required = set(old_flat.get("required", []))
+                new_required = set(new_flat.get("required", []))
+
+                # Check required properties changes
+                if check_backward:
+                    # Backward: cannot add required properties
+                    newly_required = new_required - old_required
+                    if newly_required:
+                        errors.append(
+                            f"{prefix}Added required properties: {', '.join(newly_required)}"
+                        )
+                else:
+                    # Forward: cannot remove required properties
+                    removed_required = old_required - new_required
+                    if removed_required:
+                        errors.append(
+                            f"{prefix}Removed required properties: {', '.join(removed_required)}"
+                        )
+
+                # Check properties that exist in both schemas
+                common_props = set(old_props.keys()) & set(new_props.keys())
+                stack.append((iter(common_props), old_props, new_props, prefix))
+                continue
+
+            props_iter, old_props, new_props, prefix = stack[-1]
+            prop = next(props_iter, None)
+            if prop is None:
+                stack.pop()
+                continue
 
-        # Check properties that exist in both schemas
-        common_props = set(old_props.keys()) & set(new_props.keys())
-        for prop in common_props:
             old_prop_schema = old_props[prop]
             new_prop_schema = new_props[prop]
 
@@ -587,7 +738,7 @@ class GtsEntityCastResult:
             new_type = new_prop_schema.get("type")
             if old_type and new_type and old_type != new_type:
                 errors.append(
-                    f"Property '{prop}' type changed from {old_type} to {new_type}"
+                    f"{prefix}Property '{prop}' type changed from {old_type} to {new_type}"
                 )
 
             # Check enum constraints
@@ -601,32 +752,30 @@ class GtsEntityCastResult:
                     added_enum_values = new_enum_set - old_enum_set
                     if added_enum_values:
                         errors.append(
-                            f"Property '{prop}' added enum values: {added_enum_values}"
+                            f"{prefix}Property '{prop}' added enum values: {added_enum_values}"
                         )
                 else:
                     # Forward: cannot remove enum values
                     removed_enum_values = old_enum_set - new_enum_set
                     if removed_enum_values:
                         errors.append(
-                            f"Property '{prop}' removed enum values: {removed_enum_values}"
+                            f"{prefix}Property '{prop}' removed enum values: {removed_enum_values}"
                         )
 
             # Check constraint compatibility
             constraint_errors = GtsEntityCastResult._check_constraint_compatibility(
                 prop, old_prop_schema, new_prop_schema, check_tightening=check_backward
             )
-            errors.extend(constraint_errors)
+            for err in constraint_errors:
+                errors.append(f"{prefix}{err}")
 
-            # Recursively check nested object properties
+            # Descend into nested object properties before the next sibling
             if old_type == "object" and new_type == "object":
-                nested_compat, nested_errors = (
-                    GtsEntityCastResult._check_schema_compatibility(
-                        old_prop_schema, new_prop_schema, check_backward
-                    )
+                pending = (
+                    old_prop_schema,
+                    new_prop_schema,
+                    f"{prefix}Property '{prop}': ",
                 )
-                if not nested_compat:
-                    for err in nested_errors:
-                        errors.append(f"Property '{prop}': {err}")
 
         return len(errors) == 0, errors
 
@@ -715,76 +864,3 @@ class GtsEntityCastResult:
         for k in sorted(a_req - b_req):
             rp = f"{base}.{k}" if base else k
             changed.append({"path": rp, "change": "required: removed"})
-
-    @staticmethod
-    def _path_label(path: str) -> str:
-        return path if path else "root"
-
-    @staticmethod
-    def _filtered(d: Dict[str, Any]) -> Dict[str, Any]:
-        exclude = ("properties", "required")
-        return {k: v for k, v in d.items() if k not in exclude}
-
-    @staticmethod
-    def _only_optional_add_remove(
-        a: Dict[str, Any],
-        b: Dict[str, Any],
-        path: str,
-        reasons: List[str],
-    ) -> bool:
-        if not isinstance(a, dict) or not isinstance(b, dict):
-            if a != b:
-                reasons.append(
-                    f"{GtsEntityCastResult._path_label(path)}: value changed"
-                )
-                return False
-            return True
-
-        fa = GtsEntityCastResult._filtered(a)
-        fb = GtsEntityCastResult._filtered(b)
-        if fa != fb:
-            keys = set(fa.keys()) | set(fb.keys())
-            for k in sorted(keys):
-                va = fa.get(k, "<missing>")
-                vb = fb.get(k, "<missing>")
-                if va != vb:
-                    reasons.append(
-                        f"{GtsEntityCastResult._path_label(path)}: keyword '{k}' changed"
-                    )
-            return False
-
-        a_req = (
-            set(a.get("required", [])) if isinstance(a.get("required"), list) else set()
-        )
-        b_req = (
-            set(b.get("required", [])) if isinstance(b.get("required"), list) else set()
-        )
-        if a_req != b_req:
-            added_req = sorted(list(b_req - a_req))
-            removed_req = sorted(list(a_req - b_req))
-            if added_req:
-                reasons.append(
-                    f"{GtsEntityCastResult._path_label(path)}: required added -> "
-                    f"{', '.join(added_req)}"
-                )
-            if removed_req:
-                reasons.append(
-                    f"{GtsEntityCastResult._path_label(path)}: required removed -> "
-                    f"{', '.join(removed_req)}"
-                )
-            return False
-
-        a_props = (
-            a.get("properties", {}) if isinstance(a.get("properties"), dict) else {}
-        )
-        b_props = (
-            b.get("properties", {}) if isinstance(b.get("properties"), dict) else {}
-        )
-        common = set(a_props.keys()) & set(b_props.keys())
-        for k in common:
-            next_path = f"{path}.properties.{k}" if path else f"properties.{k}"
-            if not GtsEntityCastResult._only_optional_add_remove(
-                a_props[k], b_props[k], next_path, reasons
-            ):
-                return False
-        return True
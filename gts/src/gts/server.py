@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+import json
+import math
 import sys
 
 from fastapi import FastAPI, Body, Query
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from starlette.middleware.base import BaseHTTPMiddleware
-import time
+from fastapi.responses import JSONResponse, Response
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from time import perf_counter_ns
 import logging
 
 from .ops import GtsOps
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 
 # ANSI color codes
 class Colors:
@@ -31,119 +38,242 @@ class Colors:
     MAGENTA = "\033[95m" if _USE_COLORS else ""  # Duration
     GRAY = "\033[90m" if _USE_COLORS else ""  # DEBUG content
 
+    # Request summary line: method, path, status color, status code, duration (ms)
+    LOG_FMT = (
+        f"{CYAN}%s{RESET} {BLUE}%s{RESET} -> %s%d{RESET} in {MAGENTA}%.1fms{RESET}"
+    )
 
-class _RequestLoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, verbose: int) -> None:
-        super().__init__(app)
-        self.verbose = verbose
-
-    async def dispatch(self, request, call_next):
-        if not self.verbose:
-            return await call_next(request)
-
-        start = time.time()
-
-        # Cache request body for DEBUG logging (verbose >= 2)
-        cached_body = None
-        if self.verbose >= 2:
-            # Read and cache the request body
-            cached_body = await request.body()
-
-            # Create a new request with the cached body
-            from starlette.requests import Request
 
-            async def receive():
-                return {"type": "http.request", "body": cached_body}
+# Docs/tooling endpoints that are never logged
+_EXCLUDED_PATHS = frozenset({"/openapi.json", "/docs", "/redoc", "/favicon.ico"})
 
-            request = Request(request.scope, receive)
 
-        response = await call_next(request)
-        dur = (time.time() - start) * 1000.0
-
-        # Determine status color
-        if 200 <= response.status_code < 300:
-            status_color = Colors.GREEN
-        elif 300 <= response.status_code < 400:
-            status_color = Colors.YELLOW
-        else:
-            status_color = Colors.RED
-
-        # Log response at INFO level (verbose >= 1)
-        logging.info(
-            f"{Colors.CYAN}{request.method}{Colors.RESET} "
-            f"{Colors.BLUE}{request.url.path}{Colors.RESET} -> "
-            f"{status_color}{response.status_code}{Colors.RESET} "
-            f"in {Colors.MAGENTA}{dur:.1f}ms{Colors.RESET}"
+def _pretty_json(body: bytes) -> str:
+    """Re-indent a JSON body for DEBUG logging; raises if it is not JSON."""
+    if orjson is not None:
+        return orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2).decode(
+            "utf-8"
         )
+    return json.dumps(json.loads(body.decode("utf-8")), indent=2)
 
-        # Log request body at DEBUG level (verbose >= 2)
-        if self.verbose >= 2 and cached_body:
-            try:
-                import json
-
-                body_json = json.loads(cached_body.decode("utf-8"))
-                body_str = json.dumps(body_json, indent=2)
-                logging.debug(
-                    f"{Colors.DIM}Request body:{Colors.RESET}\n"
-                    f"{Colors.GRAY}{body_str}{Colors.RESET}"
-                )
-            except Exception:
-                body_str = cached_body.decode("utf-8", errors="replace")
-                logging.debug(
-                    f"{Colors.DIM}Request body (raw):{Colors.RESET}\n"
-                    f"{Colors.GRAY}{body_str}{Colors.RESET}"
-                )
-
-        # Log response body at DEBUG level (verbose >= 2)
-        if self.verbose >= 2:
-            # Read response body
-            from starlette.responses import StreamingResponse, Response
-
-            if isinstance(response, (Response, StreamingResponse)):
-                response_body = b""
-                async for chunk in response.body_iterator:
-                    response_body += chunk
-
-                if response_body:
-                    try:
-                        import json
-
-                        body_json = json.loads(response_body.decode("utf-8"))
-                        body_str = json.dumps(body_json, indent=2)
-                        logging.debug(
-                            f"{Colors.DIM}Response body:{Colors.RESET}\n"
-                            f"{Colors.GRAY}{body_str}{Colors.RESET}"
-                        )
-                    except Exception:
-                        body_str = response_body.decode("utf-8", errors="replace")
-                        logging.debug(
-                            f"{Colors.DIM}Response body (raw):{Colors.RESET}\n"
-                            f"{Colors.GRAY}{body_str}{Colors.RESET}"
-                        )
-
-                # Recreate response with the body
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type,
-                )
-
-        return response
 
+class _RequestLoggingMiddleware:
+    """Pure ASGI middleware that logs each request (and bodies at verbose >= 2).
 
-class SchemaRegister(BaseModel):
-    type_id: str
-    schema_content: Dict[str, Any] = Field(..., alias="schema")
+    Request and response bodies are observed by wrapping ``receive`` and
+    ``send``; only the first ``max_log_body_bytes`` (plus at most one chunk)
+    are kept for logging and the messages themselves pass through untouched.
+    """
 
+    def __init__(
+        self, app: ASGIApp, verbose: int, max_log_body_bytes: int = 4096
+    ) -> None:
+        self.app = app
+        self.verbose = verbose
+        # Bodies larger than this are logged as a raw, truncated prefix
+        self.max_log_body_bytes = max_log_body_bytes
+
+    def _log_body(self, label: str, body: bytes, size: int) -> None:
+        """Log a request/response body of ``size`` bytes at DEBUG level.
+
+        ``body`` may be just the buffered prefix when ``size`` is larger
+        than max_log_body_bytes.
+        """
+        if size > self.max_log_body_bytes:
+            body_str = body[: self.max_log_body_bytes].decode("utf-8", errors="replace")
+            logging.debug(
+                f"{Colors.DIM}{label} ({size} bytes, truncated):{Colors.RESET}\n"
+                f"{Colors.GRAY}{body_str}{Colors.RESET}"
+            )
+            return
+        try:
+            body_str = _pretty_json(body)
+            logging.debug(
+                f"{Colors.DIM}{label}:{Colors.RESET}\n"
+                f"{Colors.GRAY}{body_str}{Colors.RESET}"
+            )
+        except Exception:
+            body_str = body.decode("utf-8", errors="replace")
+            logging.debug(
+                f"{Colors.DIM}{label} (raw):{Colors.RESET}\n"
+                f"{Colors.GRAY}{body_str}{Colors.RESET}"
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.verbose:
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        if path in _EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter_ns()
+        # Skip body capture entirely when DEBUG records would be dropped anyway
+        debug = self.verbose >= 2 and logging.getLogger().isEnabledFor(logging.DEBUG)
+        limit = self.max_log_body_bytes
+        # Body prefixes kept for logging, plus the full body sizes
+        req_buf = bytearray()
+        req_size = 0
+        resp_buf = bytearray()
+        resp_size = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal req_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                if req_size <= limit:
+                    req_buf.extend(chunk)
+                req_size += len(chunk)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal resp_size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                dur = (perf_counter_ns() - start) / 1_000_000.0
+
+                # Determine status color
+                if 200 <= status < 300:
+                    status_color = Colors.GREEN
+                elif 300 <= status < 400:
+                    status_color = Colors.YELLOW
+                else:
+                    status_color = Colors.RED
+
+                # Log response at INFO level (verbose >= 1)
+                logging.info(
+                    Colors.LOG_FMT,
+                    scope["method"],
+                    path,
+                    status_color,
+                    status,
+                    dur,
+                )
 
-class CastRequest(BaseModel):
-    instance_id: str
-    to_schema_id: str
+                # Log request body at DEBUG level (verbose >= 2)
+                if debug and req_size:
+                    self._log_body("Request body", bytes(req_buf), req_size)
+            elif debug and message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                if resp_size <= limit:
+                    resp_buf.extend(chunk)
+                resp_size += len(chunk)
+            await send(message)
 
+        await self.app(scope, receive_wrapper if debug else receive, send_wrapper)
 
-class ValidateInstanceRequest(BaseModel):
-    instance_id: str
+        # Log response body at DEBUG level (verbose >= 2)
+        if debug and resp_size:
+            self._log_body("Response body", bytes(resp_buf), resp_size)
+
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed.
+
+    A local subclass rather than fastapi's ORJSONResponse, which is deprecated
+    in recent FastAPI releases and requires orjson unconditionally.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        try:
+            body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the stdlib encoder handles
+            return super().render(content)
+        # orjson writes NaN/Infinity as null; let the stock encoder reject them
+        if b"null" in body and _has_non_finite(content):
+            return super().render(content)
+        return body
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if obj contains a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+# Rendered JSON bodies of the pure id endpoints (validate/parse/match/uuid),
+# keyed by (operation, *args). Their results never depend on the store.
+_RESPONSE_CACHE_MAX = 1024
+_response_cache: Dict[Tuple[str, ...], bytes] = {}
+
+
+def _cached_json(
+    key: Tuple[str, ...], produce: Callable[[], Dict[str, Any]]
+) -> Response:
+    """Serve the JSON body for key from cache, rendering produce() on a miss."""
+    body = _response_cache.get(key)
+    if body is None:
+        body = _FastJSONResponse(produce()).body
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = body
+    return Response(content=body, media_type="application/json")
+
+
+def _body_doc(**props: str) -> Dict[str, Any]:
+    """OpenAPI requestBody for a JSON object with the given required fields."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "required": list(props),
+                        "properties": {k: {"type": t} for k, t in props.items()},
+                    }
+                }
+            },
+        }
+    }
+
+
+async def _json_body(request: Request) -> Any:
+    """Parse the JSON request body; raises ValueError if it is malformed."""
+    raw = await request.body()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _pluck(body: Any, *fields: Tuple[str, type]) -> List[Any]:
+    """Return the given top-level fields of a JSON object body.
+
+    Raises KeyError(name) for a missing field and TypeError(name) for a
+    non-object body or a field of the wrong type.
+    """
+    if not isinstance(body, dict):
+        raise TypeError("")
+    values = []
+    for name, kind in fields:
+        value = body[name]
+        if not isinstance(value, kind):
+            raise TypeError(name)
+        values.append(value)
+    return values
+
+
+def _invalid_body(exc: Exception, body: Any) -> JSONResponse:
+    """422 response shaped like FastAPI's request validation errors."""
+    # KeyError/TypeError from _pluck carry the field name; JSON errors do not
+    field = exc.args[0] if isinstance(exc, (KeyError, TypeError)) and exc.args else ""
+    loc = ["body", field] if field else ["body"]
+    if isinstance(exc, KeyError):
+        error = {"type": "missing", "loc": loc, "msg": "Field required", "input": body}
+    elif isinstance(exc, TypeError):
+        value = body.get(field) if field and isinstance(body, dict) else body
+        error = {"type": "type_error", "loc": loc, "msg": "Wrong type", "input": value}
+    else:
+        error = {"type": "json_invalid", "loc": loc, "msg": "JSON decode error"}
+    return _FastJSONResponse({"detail": [error]}, status_code=422)
 
 
 class GtsHttpServer:
@@ -158,11 +288,16 @@ class GtsHttpServer:
         self.host = host
         self.port = port
         self.base_url = f"http://{self.host}:{self.port}"
-        self.app = FastAPI(title="GTS Server", version="0.1.0")
-        self.app.add_middleware(
-            _RequestLoggingMiddleware,
-            verbose=self.ops.verbose,
+        self.app = FastAPI(
+            title="GTS Server",
+            version="0.1.0",
+            default_response_class=_FastJSONResponse,
         )
+        if self.ops.verbose:
+            self.app.add_middleware(
+                _RequestLoggingMiddleware,
+                verbose=self.ops.verbose,
+            )
         self._register_routes()
 
     # Routes registration grouped here to avoid free functions
@@ -175,35 +310,36 @@ class GtsHttpServer:
             self.get_entities,
             methods=["GET"],
             summary="Get all entities in the registry",
-            response_class=JSONResponse,
+            response_class=_FastJSONResponse,
         )
         app.add_api_route(
             "/entities/{gts_id:path}",
             self.get_entity,
             methods=["GET"],
             summary="Get a specific entity by GTS ID",
-            response_class=JSONResponse,
+            response_class=_FastJSONResponse,
         )
         app.add_api_route(
             "/entities",
             self.add_entity,
             methods=["POST"],
             summary=("Register a single entity (object or schema)"),
-            response_class=JSONResponse,
+            response_class=_FastJSONResponse,
         )
         app.add_api_route(
             "/entities/bulk",
             self.add_entities,
             methods=["POST"],
             summary="Register multiple entities",
-            response_class=JSONResponse,
+            response_class=_FastJSONResponse,
         )
         app.add_api_route(
             "/schemas",
             self.add_schema,
             methods=["POST"],
             summary="Register schema by explicit type_id",
-            response_class=JSONResponse,
+            response_class=_FastJSONResponse,
+            openapi_extra=_body_doc(type_id="string", schema="object"),
         )
 
         # Op #1 - validate id
@@ -247,6 +383,7 @@ class GtsHttpServer:
             self.validate_instance,
             methods=["POST"],
             summary="Validate instance by GTS ID",
+            openapi_extra=_body_doc(instance_id="string"),
         )
         # Op #7 - schema graph / relationships
         app.add_api_route(
@@ -268,6 +405,7 @@ class GtsHttpServer:
             self.cast,
             methods=["POST"],
             summary="Cast instance to target schema",
+            openapi_extra=_body_doc(instance_id="string", to_schema_id="string"),
         )
         # Op #10 - query
         app.add_api_route(
@@ -290,39 +428,56 @@ class GtsHttpServer:
     ) -> JSONResponse:
         result = self.ops.add_entity(body, validate=validate)
         status_code = 200 if result.ok else 422
-        return JSONResponse(result.to_dict(), status_code=status_code)
+        return _FastJSONResponse(result.to_dict(), status_code=status_code)
 
     async def add_entities(
         self, body: List[Dict[str, Any]] = Body(...)
     ) -> JSONResponse:
-        return JSONResponse(self.ops.add_entities(body).to_dict())
-
-    async def add_schema(self, body: SchemaRegister) -> JSONResponse:
-        return JSONResponse(
-            self.ops.add_schema(body.type_id, body.schema_content).to_dict()
+        # Runs on the event loop like every other handler: the store isn't
+        # thread-safe, so it must not be mutated from a worker thread
+        return _FastJSONResponse(self.ops.add_entities(body).to_dict())
+
+    async def add_schema(self, request: Request) -> JSONResponse:
+        body = None
+        try:
+            body = await _json_body(request)
+            type_id, schema = _pluck(body, ("type_id", str), ("schema", dict))
+        except (ValueError, KeyError, TypeError) as e:
+            return _invalid_body(e, body)
+        return _FastJSONResponse(self.ops.add_schema(type_id, schema).to_dict())
+
+    async def validate_id(self, id: str = Query(..., alias="gts_id")) -> Response:
+        return _cached_json(
+            ("validate_id", id), lambda: self.ops.validate_id(id).to_dict()
         )
 
-    async def validate_id(self, id: str = Query(..., alias="gts_id")) -> Dict[str, Any]:
-        return self.ops.validate_id(id).to_dict()
-
     async def extract_id(self, body: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
         return self.ops.extract_id(body).to_dict()
 
-    async def parse(self, id: str = Query(..., alias="gts_id")) -> Dict[str, Any]:
-        return self.ops.parse_id(id).to_dict()
+    async def parse(self, id: str = Query(..., alias="gts_id")) -> Response:
+        return _cached_json(("parse_id", id), lambda: self.ops.parse_id(id).to_dict())
 
     async def match_id_pattern(
         self,
         candidate: str = Query(...),
         pattern: str = Query(...),
-    ) -> Dict[str, Any]:
-        return self.ops.match_id_pattern(candidate, pattern).to_dict()
+    ) -> Response:
+        return _cached_json(
+            ("match_id_pattern", candidate, pattern),
+            lambda: self.ops.match_id_pattern(candidate, pattern).to_dict(),
+        )
 
-    async def id_to_uuid(self, id: str = Query(..., alias="gts_id")) -> Dict[str, Any]:
-        return self.ops.uuid(id).to_dict()
+    async def id_to_uuid(self, id: str = Query(..., alias="gts_id")) -> Response:
+        return _cached_json(("uuid", id), lambda: self.ops.uuid(id).to_dict())
 
-    async def validate_instance(self, body: ValidateInstanceRequest) -> Dict[str, Any]:
-        return self.ops.validate_instance(body.instance_id).to_dict()
+    async def validate_instance(self, request: Request) -> Any:
+        body = None
+        try:
+            body = await _json_body(request)
+            (instance_id,) = _pluck(body, ("instance_id", str))
+        except (ValueError, KeyError, TypeError) as e:
+            return _invalid_body(e, body)
+        return self.ops.validate_instance(instance_id).to_dict()
 
     async def schema_graph(
         self, id: str = Query(..., alias="gts_id")
@@ -336,8 +491,16 @@ class GtsHttpServer:
     ) -> Dict[str, Any]:
         return self.ops.compatibility(old, new).to_dict()
 
-    async def cast(self, body: CastRequest) -> Dict[str, Any]:
-        return self.ops.cast(body.instance_id, body.to_schema_id).to_dict()
+    async def cast(self, request: Request) -> Any:
+        body = None
+        try:
+            body = await _json_body(request)
+            instance_id, to_schema_id = _pluck(
+                body, ("instance_id", str), ("to_schema_id", str)
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            return _invalid_body(e, body)
+        return self.ops.cast(instance_id, to_schema_id).to_dict()
 
     async def query(
         self, expr: str = Query(...), limit: int = Query(100, ge=1, le=1000)
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, Set, Tuple, List, Any, Optional, Iterator
+from collections import OrderedDict, defaultdict
+from typing import Dict, Set, Tuple, List, Any, Optional, Iterable, Iterator, ItemsView
 
-from jsonschema import validate as js_validate
-from jsonschema import RefResolver
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012, specification_with
 
 from .gts import GtsID, GtsWildcard
 from .entities import GtsEntity
 from .schema_cast import GtsEntityCastResult
 from .x_gts_ref import XGtsRefValidator
 
+import copy
+import itertools
 import logging
+import re
+import sys
 
 
 class StoreGtsObjectNotFound(Exception):
@@ -62,6 +70,10 @@ class StoreGtsCastFromSchemaNotAllowed(Exception):
 class GtsReader(ABC):
     """Abstract base class for reading JSON entities from various sources."""
 
+    # True if iterating yields every entity read_by_id() could ever return, so
+    # a store populated from this reader never needs to fall back to it
+    exhaustive: bool = False
+
     @abstractmethod
     def __iter__(self) -> Iterator[GtsEntity]:
         """Return an iterator that yields JsonEntity objects."""
@@ -83,6 +95,8 @@ class GtsReader(ABC):
 
 
 class GtsStoreQueryResultEntry:
+    __slots__ = ("id", "schema_id", "is_schema")
+
     def __init__(self):
         self.id = ""
         self.schema_id = ""
@@ -90,6 +104,8 @@ class GtsStoreQueryResultEntry:
 
 
 class GtsStoreQueryResult:
+    __slots__ = ("error", "count", "limit", "results")
+
     def __init__(self):
         self.error = ""
         self.count = 0
@@ -107,31 +123,219 @@ class GtsStoreQueryResult:
         }
 
 
+# (base_pattern, is_wildcard, filters, wildcard_pattern, exact_gts_id, error)
+_ParsedQuery = Tuple[
+    str, bool, Dict[str, str], Optional[GtsWildcard], Optional[GtsID], str
+]
+_QUERY_CACHE_MAX = 512
+# (is_backward, backward_errors, is_forward, forward_errors)
+_CompatResult = Tuple[bool, Tuple[str, ...], bool, Tuple[str, ...]]
+_COMPAT_CACHE_MAX = 1024
+# Values a "*" query filter treats as missing (compared without stringifying)
+_EMPTY_FILTER_VALUES = (None, "", "None")
+# Standard meta-schema URLs; never followed when building schema graphs
+_JSONSCHEMA_PREFIXES = ("http://json-schema.org", "https://json-schema.org")
+
+
+# "base[filters]": everything before the first "[", then up to the last "]"
+# (or the rest of the expression if it is unterminated)
+_QUERY_RE = re.compile(r"([^\[]*)(?:\[(?:(.*)\]|(.*)))?", re.S)
+# One "key=value" per comma-separated part; parts without "=" are ignored
+_FILTER_RE = re.compile(r"([^,=]*)=([^,]*)")
+
+
+def _is_queryable(entity: GtsEntity) -> bool:
+    """Whether query() can match an entity: dict content and a GTS ID."""
+    return isinstance(entity.content, dict) and bool(entity.gts_id)
+
+
+def _filter_value(entity: GtsEntity, field: str) -> Optional[str]:
+    """String form of a content field as query filters compare it (None if unqueryable)."""
+    if not _is_queryable(entity):
+        return None
+    value = entity.content.get(field, "")
+    return value if type(value) is str else str(value)
+
+
+def _segment_prefix(gts_id: GtsID) -> Tuple[str, ...]:
+    """Leading non-empty vendor/package/namespace/type of the first segment."""
+    if not gts_id.gts_id_segments:
+        return ()
+    seg = gts_id.gts_id_segments[0]
+    prefix: List[str] = []
+    for part in (seg.vendor, seg.package, seg.namespace, seg.type):
+        if not part:
+            break
+        prefix.append(part)
+    return tuple(prefix)
+
+
 class GtsStore:
-    def __init__(self, reader: GtsReader) -> None:
+    def __init__(self, reader: GtsReader, indexed_fields: Iterable[str] = ()) -> None:
         """
         Initialize GtsStore with an optional GtsReader.
 
         Args:
             reader: GtsReader instance to populate entities from
+            indexed_fields: Content fields to index for exact-value query
+                filters (e.g. "status"), so such queries skip non-matching
+                entities without scanning them. The indexes are updated when
+                entities are registered; after editing a stored entity's
+                content in place, call reindex() before querying again
         """
         self._by_id: Dict[str, GtsEntity] = {}
+        # The _is_queryable subset of _by_id, in the same order; the type
+        # check is done once when an entity is stored, not on every query
+        self._queryable: Dict[str, GtsEntity] = {}
+        # First-segment prefix (vendor, package, ...) -> queryable entities
+        # under it, in _by_id order, so prefix queries skip unrelated namespaces
+        self._prefix_index: Dict[Tuple[str, ...], Dict[str, GtsEntity]] = {}
+        # field -> filter string value -> entities, also in _by_id order
+        self._content_indexes: Dict[str, Dict[str, Dict[str, GtsEntity]]] = {
+            field: {} for field in indexed_fields
+        }
         self._reader = reader
-
-        # Populate entities from reader if provided
-        if self._reader:
+        # Set once an exhaustive reader has been fully iterated; get() then
+        # treats _by_id as authoritative and skips read_by_id on misses
+        self._reader_exhausted = False
+        # The reader is iterated on first access (see _ensure_populated), so a
+        # store that is never read doesn't pay for loading every entity
+        self._unpopulated = bool(reader)
+        # Parsed query expressions (see _parse_query); independent of contents
+        self._query_cache: Dict[str, _ParsedQuery] = {}
+        # LRU of is_minor_compatible results per (old_id, new_id); entries
+        # touching an id are dropped when that id is stored again
+        self._compat_cache: OrderedDict[Tuple[str, str], _CompatResult] = OrderedDict()
+        # Complete build_schema_graph results per root id, with the ids each
+        # traversal visited; an entry is dropped when any of those is stored
+        self._graph_cache: Dict[str, Tuple[Dict[str, Any], Set[str]]] = {}
+        # Checked validators per schema id; dropped whenever a schema is
+        # (re)registered so they never resolve $refs against stale content
+        self._validator_cache: Dict[str, Any] = {}
+        # Shared so its compiled x-gts-ref programs are reused across calls;
+        # invalidated together with the validators above
+        self._x_gts_ref_validator = XGtsRefValidator(store=self)
+        # gts:// URI -> schema resource, grown as schemas are registered;
+        # anything else is looked up through _retrieve_schema on demand
+        self._registry: Registry = Registry(retrieve=self._retrieve_schema)
+
+    def _ensure_populated(self) -> None:
+        """Load the reader's entities before the store is first read or changed."""
+        if self._unpopulated:
+            # Cleared only on success, so a failing reader is retried next time
             self._populate_from_reader()
-
-        logging.info(f"Populated GtsStore with {len(self._by_id)} entities")
+            self._unpopulated = False
 
     def _populate_from_reader(self) -> None:
         """Populate the store by iterating through the reader."""
         if not self._reader:
             return
 
-        for entity in self._reader:
-            if entity.gts_id and entity.gts_id.id:
-                self._by_id[entity.gts_id.id] = entity
+        self._by_id.update(
+            (sys.intern(entity.gts_id.id), entity)
+            for entity in self._reader
+            if entity.gts_id and entity.gts_id.id
+        )
+
+        # Index the loaded entities in one pass instead of per entity via _put
+        for key, entity in self._by_id.items():
+            self._index(key, entity)
+        self._registry = self._registry.with_resources(
+            (f"gts://{key}", self._schema_resource(entity.content))
+            for key, entity in self._by_id.items()
+            if entity.is_schema and isinstance(entity.content, dict)
+        )
+        self._reader_exhausted = getattr(self._reader, "exhaustive", False)
+
+        logging.info(f"Populated GtsStore with {len(self._by_id)} entities")
+
+    def _put(self, key: str, entity: GtsEntity) -> None:
+        """Store an entity under key and keep the query indexes in sync."""
+        self._ensure_populated()
+        # Interned keys make later probes with the same id string pointer-equal
+        key = sys.intern(key)
+        old = self._by_id.get(key)
+        self._by_id[key] = entity
+        if self._graph_cache:
+            for root in [r for r, (_, ids) in self._graph_cache.items() if key in ids]:
+                del self._graph_cache[root]
+        if self._compat_cache:
+            for pair in [p for p in self._compat_cache if key in p]:
+                del self._compat_cache[pair]
+        if old is None:
+            self._index(key, entity)
+        elif _is_queryable(old) != _is_queryable(entity) or (
+            _is_queryable(entity)
+            and _segment_prefix(old.gts_id) != _segment_prefix(entity.gts_id)
+        ):
+            # Rebuild so that every bucket keeps _by_id order for this key
+            self._rebuild_indexes()
+        else:
+            changed = [
+                field
+                for field in self._content_indexes
+                if _filter_value(entity, field) != _filter_value(old, field)
+            ]
+            # Assigning to existing keys keeps their position in each bucket
+            self._index(key, entity)
+            for field in changed:
+                self._rebuild_content_index(field)
+
+    def _index(self, key: str, entity: GtsEntity) -> None:
+        """Add a queryable entity to the query indexes (no-op otherwise)."""
+        if not _is_queryable(entity):
+            return
+        self._queryable[key] = entity
+        prefix = _segment_prefix(entity.gts_id)
+        for n in range(1, len(prefix) + 1):
+            self._prefix_index.setdefault(prefix[:n], {})[key] = entity
+        for field, index in self._content_indexes.items():
+            index.setdefault(_filter_value(entity, field), {})[key] = entity
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all query indexes from _by_id."""
+        self._queryable = {}
+        self._prefix_index = {}
+        self._content_indexes = {field: {} for field in self._content_indexes}
+        for key, entity in self._by_id.items():
+            self._index(key, entity)
+
+    def _rebuild_content_index(self, field: str) -> None:
+        """Re-index one content field from scratch."""
+        index: Dict[str, Dict[str, GtsEntity]] = {}
+        for key, entity in self._queryable.items():
+            index.setdefault(_filter_value(entity, field), {})[key] = entity
+        self._content_indexes[field] = index
+
+    def _invalidate_schema_caches(self) -> None:
+        """Forget validators built against previously registered schemas."""
+        self._validator_cache.clear()
+        self._x_gts_ref_validator.invalidate()
+
+    @staticmethod
+    def _schema_resource(content: Dict[str, Any]) -> Resource:
+        """Wrap schema content as a resource of its declared draft (2020-12 by default)."""
+        dialect = content.get("$schema")
+        if not isinstance(dialect, str):
+            dialect = ""
+        return specification_with(dialect, default=DRAFT202012).create_resource(content)
+
+    def _add_schema_resource(self, type_id: str, content: Any) -> None:
+        """Make a schema resolvable as gts://<type_id> through the shared registry."""
+        if isinstance(content, dict):
+            self._registry = self._registry.with_resource(
+                uri=f"gts://{type_id}", resource=self._schema_resource(content)
+            )
+
+    def _retrieve_schema(self, uri: str) -> Resource:
+        """Registry retrieve hook for refs not registered yet (e.g. bare GTS IDs)."""
+        # Issue #32: handle gts:// prefix
+        type_id = uri[6:] if uri.startswith("gts://") else uri
+        try:
+            content = self.get_schema_content(type_id)
+        except KeyError:
+            raise NoSuchResource(ref=uri)
+        return self._schema_resource(content)
 
     def register(self, entity: GtsEntity) -> None:
         """Register a GtsEntity in the store.
@@ -139,11 +343,15 @@ class GtsStore:
         If entity has a valid gts_id, use that as the key.
         Otherwise, use raw_id for non-GTS entities.
         """
+        if entity.is_schema:
+            self._invalidate_schema_caches()
         if entity.gts_id and entity.gts_id.id:
-            self._by_id[entity.gts_id.id] = entity
+            self._put(entity.gts_id.id, entity)
+            if entity.is_schema:
+                self._add_schema_resource(entity.gts_id.id, entity.content)
         elif entity.raw_id:
             # Allow non-GTS entities with raw_id (e.g., UUIDs or simple strings)
-            self._by_id[entity.raw_id] = entity
+            self._put(entity.raw_id, entity)
         else:
             raise ValueError("Entity must have a valid gts_id or raw_id")
 
@@ -157,7 +365,9 @@ class GtsStore:
         # parse sanity
         gts_id = GtsID(type_id)
         entity = GtsEntity(content=schema, gts_id=gts_id, is_schema=True)
-        self._by_id[type_id] = entity
+        self._invalidate_schema_caches()
+        self._put(type_id, entity)
+        self._add_schema_resource(type_id, schema)
 
     def get(self, entity_id: str) -> Optional[GtsEntity]:
         """
@@ -165,15 +375,22 @@ class GtsStore:
         If not found in cache, try to fetch from reader.
         Returns None if not found.
         """
+        if self._unpopulated:
+            self._ensure_populated()
+
         # Check cache first
-        if entity_id in self._by_id:
-            return self._by_id[entity_id]
+        entity = self._by_id.get(entity_id)
+        if entity is not None or self._reader_exhausted:
+            return entity
 
         # Try to fetch from reader
         if self._reader:
             entity = self._reader.read_by_id(entity_id)
             if entity:
-                self._by_id[entity_id] = entity
+                self._put(entity_id, entity)
+                if entity.is_schema:
+                    self._invalidate_schema_caches()
+                    self._add_schema_resource(entity_id, entity.content)
                 return entity
 
         return None
@@ -185,35 +402,25 @@ class GtsStore:
             return entity.content
         raise KeyError(f"Schema not found: {type_id}")
 
-    def _create_ref_resolver(self, schema: Dict[str, Any]) -> RefResolver:
-        """Create a custom RefResolver that can resolve GTS ID references from the store."""
+    def items(self) -> ItemsView[str, GtsEntity]:
+        """Return a live view of all entity ID and entity pairs.
 
-        def resolve_gts_ref(uri: str) -> Dict[str, Any]:
-            """Resolve a GTS ID reference to its schema content."""
-            # Issue #32: handle gts:// prefix
-            if uri.startswith("gts://"):
-                uri = uri[6:]
-            try:
-                return self.get_schema_content(uri)
-            except KeyError:
-                raise Exception(f"Unresolvable: {uri}")
-
-        # Create a store dict that maps GTS IDs to their schema content
-        store = {}
-        for entity_id, entity in self._by_id.items():
-            if entity.is_schema and isinstance(entity.content, dict):
-                store[entity_id] = entity.content
-
-        # Create RefResolver with custom handlers
-        # Issue #32: Support "gts" scheme
-        handlers = {"": resolve_gts_ref, "gts": resolve_gts_ref}
-        resolver = RefResolver.from_schema(schema, store=store, handlers=handlers)
-        return resolver
-
-    def items(self):
-        """Return all entity ID and entity pairs."""
+        The view is not a copy; don't register entities while iterating it.
+        """
+        self._ensure_populated()
         return self._by_id.items()
 
+    def reindex(self) -> None:
+        """Rebuild the indexed_fields indexes from the stored entities' content.
+
+        Needed only when content was changed in place rather than through
+        register(); until then, an exact filter on an indexed field can miss
+        an entity whose value for that field was changed.
+        """
+        self._ensure_populated()
+        for field in self._content_indexes:
+            self._rebuild_content_index(field)
+
     @staticmethod
     def _validate_schema_refs(schema: Dict[str, Any], path: str = "") -> None:
         """
@@ -368,25 +575,125 @@ class GtsStore:
             obj: The object to validate
             gts_id: The GTS ID of the object (used to find the schema)
         """
+        obj, schema_entity = self._get_entity_and_schema(gts_id)
+        schema = schema_entity.content
+
+        logging.info(f"Validating instance {gts_id} against schema {obj.schemaId}")
+
+        validator = self._instance_validator(obj.schemaId, schema)
+        self._check_instance(obj, schema, validator, self._x_gts_ref_validator)
+
+    def _get_entity_and_schema(self, gts_id: str) -> Tuple[GtsEntity, GtsEntity]:
+        """
+        Fetch an instance and its schema entity, one lookup each.
+
+        Raises:
+            StoreGtsObjectNotFound: If the instance isn't in the store
+            StoreGtsSchemaForInstanceNotFound: If the instance has no schema ID
+            StoreGtsSchemaNotFound: If the schema is missing or not a dict
+        """
         gid = GtsID(gts_id)
         obj = self.get(gid.id)
         if not obj:
             raise StoreGtsObjectNotFound(gts_id)
         if not obj.schemaId:
             raise StoreGtsSchemaForInstanceNotFound(gid.id)
+        schema_entity = self.get(obj.schemaId)
+        if not schema_entity or not isinstance(schema_entity.content, dict):
+            raise StoreGtsSchemaNotFound(obj.schemaId)
+        return obj, schema_entity
+
+    def validate_instances(self, gts_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Validate many instances, grouped by schema so that each schema is
+        looked up and its validator built only once.
+
+        Args:
+            gts_ids: GTS IDs of the instances to validate
+
+        Returns:
+            Error message per failing instance ID, in input order (empty if
+            all instances are valid)
+        """
+        gts_ids = list(gts_ids)
+        errors: Dict[str, str] = {}
+        groups: Dict[str, List[Tuple[str, GtsEntity]]] = defaultdict(list)
+        for gts_id in gts_ids:
+            try:
+                gid = GtsID(gts_id)
+                obj = self.get(gid.id)
+                if not obj:
+                    raise StoreGtsObjectNotFound(gts_id)
+                if not obj.schemaId:
+                    raise StoreGtsSchemaForInstanceNotFound(gid.id)
+            except Exception as e:
+                errors[gts_id] = str(e)
+                continue
+            groups[obj.schemaId].append((gts_id, obj))
+
+        x_gts_ref_validator = self._x_gts_ref_validator
+        for schema_id, members in groups.items():
+            logging.info(
+                f"Validating {len(members)} instance(s) against schema {schema_id}"
+            )
+            try:
+                validator = self.get_compiled_validator(schema_id)
+                schema = validator.schema
+            except Exception as e:
+                for gts_id, _ in members:
+                    errors[gts_id] = str(e)
+                continue
+            for gts_id, obj in members:
+                try:
+                    self._check_instance(obj, schema, validator, x_gts_ref_validator)
+                except Exception as e:
+                    errors[gts_id] = str(e)
+
+        return {gts_id: errors[gts_id] for gts_id in gts_ids if gts_id in errors}
+
+    def get_compiled_validator(self, schema_id: str) -> Any:
+        """
+        Get the checked jsonschema validator for a schema, built once per schema.
+
+        The validator is cached until a schema is (re)registered, and resolves
+        GTS ID references through the store's registry.
+
+        Raises:
+            StoreGtsSchemaNotFound: If the schema is missing or not a dict
+        """
         try:
-            schema = self.get_schema_content(obj.schemaId)
+            schema = self.get_schema_content(schema_id)
         except KeyError:
-            raise StoreGtsSchemaNotFound(obj.schemaId)
+            raise StoreGtsSchemaNotFound(schema_id)
+        return self._instance_validator(schema_id, schema)
 
-        logging.info(f"Validating instance {gts_id} against schema {obj.schemaId}")
+    def _instance_validator(self, schema_id: str, schema: Dict[str, Any]) -> Any:
+        """Return the cached checked validator for a schema, building it once.
 
-        # Create custom RefResolver to resolve GTS ID references
-        resolver = self._create_ref_resolver(schema)
-        js_validate(instance=obj.content, schema=schema, resolver=resolver)
+        The validator resolves GTS ID references through the registry; same
+        semantics as jsonschema.validate().
+        """
+        validator = self._validator_cache.get(schema_id)
+        if validator is None:
+            validator_cls = validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema, registry=self._registry)
+            self._validator_cache[schema_id] = validator
+        return validator
+
+    @staticmethod
+    def _check_instance(
+        obj: GtsEntity,
+        schema: Dict[str, Any],
+        validator: Any,
+        x_gts_ref_validator: XGtsRefValidator,
+    ) -> None:
+        """Raise if an instance fails its schema or its x-gts-ref constraints."""
+        error = best_match(validator.iter_errors(obj.content))
+        if error is not None:
+            raise error
 
         # Validate x-gts-ref constraints
-        x_gts_ref_validator = XGtsRefValidator(store=self)
         x_gts_ref_errors = x_gts_ref_validator.validate_instance(obj.content, schema)
         if x_gts_ref_errors:
             error_messages = [
@@ -410,22 +717,16 @@ class GtsStore:
         if not to_schema:
             raise StoreGtsObjectNotFound(target_schema_id)
 
-        # Get the source schema
-        if from_entity.is_schema:
-            from_schema = from_entity
-            from_schema_id = from_entity.gts_id.id
-        else:
-            from_schema_id = from_entity.schemaId
-            if not from_schema_id:
-                raise StoreGtsSchemaForInstanceNotFound(from_id)
-            from_schema = self.get(from_schema_id)
-            if not from_schema:
-                raise StoreGtsObjectNotFound(from_schema_id)
-
-        # Create a resolver to handle $ref in schemas
-        resolver = self._create_ref_resolver(to_schema.content)
+        # Get the source schema (from_entity is known to be an instance here)
+        from_schema_id = from_entity.schemaId
+        if not from_schema_id:
+            raise StoreGtsSchemaForInstanceNotFound(from_id)
+        from_schema = self.get(from_schema_id)
+        if not from_schema:
+            raise StoreGtsObjectNotFound(from_schema_id)
 
-        return from_entity.cast(to_schema, from_schema, resolver=resolver)
+        # The registry resolves $ref to other GTS schemas in the target
+        return from_entity.cast(to_schema, from_schema, resolver=self._registry)
 
     def is_minor_compatible(
         self,
@@ -462,16 +763,37 @@ class GtsStore:
                 casted_entity=None,
             )
 
-        old_schema = old_entity.content if isinstance(old_entity.content, dict) else {}
-        new_schema = new_entity.content if isinstance(new_entity.content, dict) else {}
+        pair = (old_schema_id, new_schema_id)
+        cached = self._compat_cache.get(pair)
+        if cached is None:
+            old_schema = (
+                old_entity.content if isinstance(old_entity.content, dict) else {}
+            )
+            new_schema = (
+                new_entity.content if isinstance(new_entity.content, dict) else {}
+            )
 
-        # Use the cast method's compatibility checking logic
-        is_backward, backward_errors = (
-            GtsEntityCastResult._check_backward_compatibility(old_schema, new_schema)
-        )
-        is_forward, forward_errors = GtsEntityCastResult._check_forward_compatibility(
-            old_schema, new_schema
-        )
+            # Use the cast method's compatibility checking logic
+            is_backward, backward_errors = (
+                GtsEntityCastResult._check_backward_compatibility(
+                    old_schema, new_schema
+                )
+            )
+            is_forward, forward_errors = (
+                GtsEntityCastResult._check_forward_compatibility(old_schema, new_schema)
+            )
+            cached = (
+                is_backward,
+                tuple(backward_errors),
+                is_forward,
+                tuple(forward_errors),
+            )
+            if len(self._compat_cache) >= _COMPAT_CACHE_MAX:
+                self._compat_cache.popitem(last=False)
+            self._compat_cache[pair] = cached
+        else:
+            self._compat_cache.move_to_end(pair)
+        is_backward, backward_errors, is_forward, forward_errors = cached
 
         # Determine direction
         direction = GtsEntityCastResult._infer_direction(old_schema_id, new_schema_id)
@@ -487,13 +809,20 @@ class GtsStore:
             is_backward_compatible=is_backward,
             is_forward_compatible=is_forward,
             incompatibility_reasons=[],
-            backward_errors=backward_errors,
-            forward_errors=forward_errors,
+            backward_errors=list(backward_errors),
+            forward_errors=list(forward_errors),
             casted_entity=None,
         )
 
     def build_schema_graph(self, gts_id: str) -> Tuple[Dict[str, Set[str]], List[str]]:
+        cached = self._graph_cache.get(gts_id)
+        if cached is not None:
+            return copy.deepcopy(cached[0])
+
         seen_gts_ids = set()
+        # Graphs with missing entities aren't cached: the reader may have them
+        # on a later get()
+        complete = [True]
 
         def gts2node(gts_id: str, seen_gts_ids: Set[str]) -> str:
             ret = {"id": gts_id}
@@ -509,49 +838,26 @@ class GtsStore:
                 for r in entity.gts_refs:
                     if r["id"] == gts_id:
                         continue
-                    if r["id"].startswith("http://json-schema.org") or r[
-                        "id"
-                    ].startswith("https://json-schema.org"):
+                    if r["id"].startswith(_JSONSCHEMA_PREFIXES):
                         continue
                     refs[r["sourcePath"]] = gts2node(r["id"], seen_gts_ids)
                 if refs:
                     ret["refs"] = refs
                 if entity.schemaId:
-                    if not entity.schemaId.startswith(
-                        "http://json-schema.org"
-                    ) and not entity.schemaId.startswith("https://json-schema.org"):
+                    if not entity.schemaId.startswith(_JSONSCHEMA_PREFIXES):
                         ret["schema_id"] = gts2node(entity.schemaId, seen_gts_ids)
                 else:
                     ret["errors"] = ret.get("errors", []) + ["Schema not recognized"]
             else:
                 ret["errors"] = ret.get("errors", []) + ["Entity not found"]
+                complete[0] = False
 
             return ret
 
-        return gts2node(gts_id, seen_gts_ids)
-
-    def _parse_query_filters(self, filter_str: str) -> Dict[str, str]:
-        """Parse filter expressions from query string.
-
-        Args:
-            filter_str: Filter string like 'status=active, category=order'
-
-        Returns:
-            Dictionary of filter key-value pairs
-        """
-        filters: Dict[str, str] = {}
-        if not filter_str:
-            return filters
-
-        # Split by comma to handle multiple filters
-        parts = [p.strip() for p in filter_str.split(",")]
-        for part in parts:
-            if "=" in part:
-                k, v = part.split("=", 1)
-                # Remove quotes from value if present
-                v = v.strip().strip('"').strip("'")
-                filters[k.strip()] = v
-        return filters
+        graph = gts2node(gts_id, seen_gts_ids)
+        if complete[0]:
+            self._graph_cache[gts_id] = (copy.deepcopy(graph), seen_gts_ids)
+        return graph
 
     def _validate_query_pattern(
         self, base_pattern: str, is_wildcard: bool
@@ -563,7 +869,9 @@ class GtsStore:
             is_wildcard: Whether the pattern contains wildcards
 
         Returns:
-            Tuple of (wildcard_pattern, exact_gts_id, error_message)
+            Tuple of (wildcard_pattern, exact_gts_id, error_message). For
+            non-wildcard patterns wildcard_pattern is the same ID parsed as a
+            GtsWildcard (for version-flexible matching), or None if it can't be.
         """
         if is_wildcard:
             # Wildcard pattern must end with .* or ~*
@@ -584,70 +892,156 @@ class GtsStore:
                 exact_gts_id = GtsID(base_pattern)
                 if not exact_gts_id.gts_id_segments:
                     return None, None, "Invalid query: GTS ID has no valid segments"
-                return None, exact_gts_id, ""
             except Exception as e:
                 return None, None, f"Invalid query: {str(e)}"
+            # Matching as a wildcard allows patterns like "gts.x.test.v1~" to
+            # match "gts.x.test.v1.0~"
+            try:
+                pattern_as_wildcard: Optional[GtsWildcard] = GtsWildcard(base_pattern)
+            except Exception:
+                # If it can't be converted to wildcard, fall back to exact match
+                pattern_as_wildcard = None
+            return pattern_as_wildcard, exact_gts_id, ""
 
     def _matches_id_pattern(
         self,
         entity_id: GtsID,
         base_pattern: str,
-        is_wildcard: bool,
         wildcard_pattern: Optional[GtsWildcard],
-        exact_gts_id: Optional[GtsID],
     ) -> bool:
         """Check if entity ID matches the query pattern.
 
         Args:
             entity_id: The entity's GTS ID
             base_pattern: The base pattern string
-            is_wildcard: Whether pattern is a wildcard
-            wildcard_pattern: Parsed wildcard pattern (if applicable)
-            exact_gts_id: Parsed exact GTS ID (if applicable)
+            wildcard_pattern: Pattern pre-parsed by _validate_query_pattern
 
         Returns:
             True if entity ID matches the pattern
         """
-        if is_wildcard and wildcard_pattern:
-            return entity_id.wildcard_match(wildcard_pattern)
-
-        # For non-wildcard patterns, use wildcard_match to support version flexibility
-        # This allows patterns like "gts.x.test.v1~" to match "gts.x.test.v1.0~"
-        if exact_gts_id:
-            try:
-                pattern_as_wildcard = GtsWildcard(base_pattern)
-                return entity_id.wildcard_match(pattern_as_wildcard)
-            except Exception:
-                # If it can't be converted to wildcard, fall back to exact match
-                return entity_id.id == base_pattern
-
+        if wildcard_pattern is not None:
+            return wildcard_pattern.match(entity_id)
         return entity_id.id == base_pattern
 
-    def _matches_filters(
-        self, entity_content: Dict[str, Any], filters: Dict[str, str]
-    ) -> bool:
-        """Check if entity content matches all filter criteria.
+    @staticmethod
+    def _compile_filters(filters: Dict[str, str]) -> List[Tuple[str, str, bool]]:
+        """Turn parsed filters into (key, value, matches_any_value) triples.
 
-        Args:
-            entity_content: The entity's content dictionary
-            filters: Dictionary of filter key-value pairs
+        A "*" value matches any non-empty value; anything else is compared with
+        the entity value's string form.
+        """
+        return [(key, value, value == "*") for key, value in filters.items()]
+
+    def _parse_query(self, expr: str) -> _ParsedQuery:
+        """Parse a query expression, memoized per expression string.
 
         Returns:
-            True if all filters match
-        """
-        if not filters:
-            return True
-
-        for key, value in filters.items():
-            entity_value = str(entity_content.get(key, ""))
-            # Support wildcard in filter values
-            if value == "*":
-                # Wildcard matches any non-empty value
-                if not entity_value or entity_value == "None":
-                    return False
-            elif entity_value != value:
-                return False
-        return True
+            Tuple of (base_pattern, is_wildcard, filters, wildcard_pattern,
+            exact_gts_id, error_message)
+        """
+        parsed = self._query_cache.get(expr)
+        if parsed is not None:
+            return parsed
+
+        # Parse the query expression to extract base pattern and filters
+        m = _QUERY_RE.match(expr)
+        base_pattern = m.group(1).strip()
+        is_wildcard = "*" in base_pattern
+
+        # Parse filters like 'status=active, category="order"', removing
+        # quotes from values
+        filters: Dict[str, str] = {}
+        for k, v in _FILTER_RE.findall(m.group(2) or m.group(3) or ""):
+            filters[k.strip()] = v.strip().strip('"').strip("'")
+
+        # Validate and create pattern
+        wildcard_pattern, exact_gts_id, error = self._validate_query_pattern(
+            base_pattern, is_wildcard
+        )
+        parsed = (
+            base_pattern,
+            is_wildcard,
+            filters,
+            wildcard_pattern,
+            exact_gts_id,
+            error,
+        )
+        if len(self._query_cache) >= _QUERY_CACHE_MAX:
+            self._query_cache.pop(next(iter(self._query_cache)))
+        self._query_cache[expr] = parsed
+        return parsed
+
+    def _iter_matches(self, expr: str) -> Iterator[Dict[str, Any]]:
+        """Yield the contents of entities matching a query expression, lazily.
+
+        Yields nothing for an invalid expression; _parse_query reports why.
+        The store must not be modified while the generator is being consumed.
+        """
+        (
+            base_pattern,
+            is_wildcard,
+            filters,
+            wildcard_pattern,
+            exact_gts_id,
+            error,
+        ) = self._parse_query(expr)
+        if error:
+            return
+        self._ensure_populated()
+
+        # Only entities sharing the pattern's fixed leading segment fields can
+        # match; an empty prefix (e.g. "gts.*") falls back to a full scan
+        pattern = wildcard_pattern or exact_gts_id
+        prefix = _segment_prefix(pattern) if pattern else ()
+        if prefix:
+            candidates = self._prefix_index.get(prefix, {})
+        else:
+            candidates = self._queryable
+
+        compiled_filters = self._compile_filters(filters)
+        # An exact filter on an indexed field narrows the scan further; the
+        # full matching below still runs, so any superset bucket is fine
+        for key, value, any_value in compiled_filters:
+            index = self._content_indexes.get(key)
+            if index is not None and not any_value:
+                bucket = index.get(value, {})
+                if len(bucket) < len(candidates):
+                    candidates = bucket
+        matches_id = self._matches_id_pattern
+
+        # Filter entities
+        # Every candidate is queryable (dict content and a GTS ID)
+        for entity in candidates.values():
+            # Check if ID matches the pattern
+            if not matches_id(entity.gts_id, base_pattern, wildcard_pattern):
+                continue
+
+            content = entity.content
+
+            # Check filters
+            for key, value, any_value in compiled_filters:
+                entity_value = content.get(key, "")
+                if any_value:
+                    # Wildcard matches any non-empty value
+                    if entity_value in _EMPTY_FILTER_VALUES:
+                        break
+                elif (
+                    entity_value if type(entity_value) is str else str(entity_value)
+                ) != value:
+                    break
+            else:
+                yield content
+
+    def iter_query(self, expr: str) -> Iterator[Dict[str, Any]]:
+        """Like query(), but yield matching entity contents without a limit.
+
+        Raises:
+            ValueError: If the query expression is invalid
+        """
+        error = self._parse_query(expr)[5]
+        if error:
+            raise ValueError(error)
+        return self._iter_matches(expr)
 
     def query(self, expr: str, limit: int = 100) -> GtsStoreQueryResult:
         """Filter entities by a GTS query expression.
@@ -665,41 +1059,11 @@ class GtsStore:
         result = GtsStoreQueryResult()
         result.limit = limit
 
-        # Parse the query expression to extract base pattern and filters
-        base, _, filt = expr.partition("[")
-        base_pattern = base.strip()
-        is_wildcard = "*" in base_pattern
-
-        # Parse filters if present
-        filter_str = filt.rsplit("]", 1)[0] if filt else ""
-        filters = self._parse_query_filters(filter_str)
-
-        # Validate and create pattern
-        wildcard_pattern, exact_gts_id, error = self._validate_query_pattern(
-            base_pattern, is_wildcard
-        )
+        error = self._parse_query(expr)[5]
         if error:
             result.error = error
             return result
 
-        # Filter entities
-        for entity in self._by_id.values():
-            if len(result.results) >= limit:
-                break
-            if not isinstance(entity.content, dict) or not entity.gts_id:
-                continue
-
-            # Check if ID matches the pattern
-            if not self._matches_id_pattern(
-                entity.gts_id, base_pattern, is_wildcard, wildcard_pattern, exact_gts_id
-            ):
-                continue
-
-            # Check filters
-            if not self._matches_filters(entity.content, filters):
-                continue
-
-            result.results.append(entity.content)
-
+        result.results = list(itertools.islice(self._iter_matches(expr), max(limit, 0)))
         result.count = len(result.results)
         return result
@@ -5,29 +5,212 @@ This module implements validation for the x-gts-ref extension as specified
 in the GTS specification section 9.5.
 
 Key optimizations:
-1. Use jsonpointer library for JSON Pointer resolution
+1. Resolve JSON Pointers with pre-split, cached pointer segments
 2. Consolidate duplicate validation logic
 3. Simplify recursive traversal with a generic walker
+4. Compile each schema once into per-node descriptors reused for every
+   instance validated against it
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .gts import GtsID, GTS_PREFIX, GTS_URI_PREFIX
+
+# Kinds of a compiled x-gts-ref, the first item of _Node.ref = (op, arg):
+# - OP_CHECK_REF: check a string instance against the GTS pattern in arg
+#   (relative "/..." x-gts-ref pointers are already resolved at compile time)
+# - OP_REF_ERROR: the x-gts-ref pointer can't be resolved to a GTS pattern;
+#   arg is (ref_pattern, reason) for the error every string instance gets
+# - OP_CHECK_REF_DYN: resolve the x-gts-ref value in arg at validation time
+#   (non-string values and cyclic pointers, which fail the same way as before)
+OP_CHECK_REF = 0
+OP_REF_ERROR = 1
+OP_CHECK_REF_DYN = 2
+
+# Bits of _Node.kind
+_HAS_REF = 1  # ref holds the compiled x-gts-ref
+_HAS_PROPS = 2  # props holds (name, child _Node) pairs for dict instances
+_HAS_ITEMS = 4  # items holds the child _Node for every list item
+# items is a plain x-gts-ref leaf; items holds its resolved GTS pattern and
+# list instances are checked in one loop instead of a stack entry per item
+_ITEMS_REF = 8
+
+
+class _PointerCycle(Exception):
+    """Raised while resolving x-gts-ref pointers that refer back to themselves."""
+
+
+_COMPILED_CACHE_MAX = 256
+
+# The wildcard every valid GTS ID matches
+_GTS_WILDCARD = GTS_PREFIX + "*"
+
+# Kinds of x-gts-ref patterns values are checked against
+_PATTERN_ANY = 0  # "gts.*": any valid GTS ID matches
+_PATTERN_WILDCARD = 1  # "<prefix>*": value must start with prefix
+_PATTERN_EXACT = 2  # no wildcard: value must start with the pattern itself
+
+# pattern -> (kind, prefix); bounded FIFO like the store's query cache
+_PATTERN_CACHE: Dict[str, Tuple[int, str]] = {}
+_PATTERN_CACHE_MAX = 512
+
+
+def _pattern_kind(pattern: str) -> Tuple[int, str]:
+    """Classify a GTS pattern once; repeated patterns are a dict lookup."""
+    cached = _PATTERN_CACHE.get(pattern)
+    if cached is not None:
+        return cached
+    if pattern == _GTS_WILDCARD:
+        cached = (_PATTERN_ANY, "")
+    elif pattern.endswith("*"):
+        cached = (_PATTERN_WILDCARD, pattern[:-1])
+    else:
+        cached = (_PATTERN_EXACT, pattern)
+    if len(_PATTERN_CACHE) >= _PATTERN_CACHE_MAX:
+        _PATTERN_CACHE.pop(next(iter(_PATTERN_CACHE)))
+    _PATTERN_CACHE[pattern] = cached
+    return cached
+
+
+# pointer -> its "/"-separated segments; bounded FIFO like the pattern cache
+_POINTER_CACHE: Dict[str, Tuple[str, ...]] = {}
+_POINTER_CACHE_MAX = 512
+
+
+def _pointer_parts(pointer: str) -> Tuple[str, ...]:
+    """Split a JSON Pointer into segments once; () for the empty pointer."""
+    parts = _POINTER_CACHE.get(pointer)
+    if parts is None:
+        path = pointer.lstrip("/")
+        parts = tuple(path.split("/")) if path else ()
+        if len(_POINTER_CACHE) >= _POINTER_CACHE_MAX:
+            _POINTER_CACHE.pop(next(iter(_POINTER_CACHE)))
+        _POINTER_CACHE[pointer] = parts
+    return parts
+
+
+_CHECK_CACHE_MAX = 4096
+_UNCHECKED = object()
 
-from .gts import GtsID, GTS_URI_PREFIX
+
+# GtsID.is_valid caches its results, valid or not
+_is_valid_gts_id = GtsID.is_valid
 
 
 class XGtsRefValidationError(Exception):
     """Exception raised when x-gts-ref validation fails."""
 
+    # Validators can return thousands of these; slots keep each instance from
+    # allocating an attribute __dict__
+    __slots__ = ("field_path", "value", "ref_pattern", "reason")
+
     def __init__(self, field_path: str, value: Any, ref_pattern: str, reason: str):
-        super().__init__(
-            f"x-gts-ref validation failed for field '{field_path}': {reason}"
-        )
+        # The message is only formatted by __str__: validators collect these
+        # and callers mostly read field_path/reason, so most are never shown.
+        super().__init__(field_path, value, ref_pattern, reason)
         self.field_path = field_path
         self.value = value
         self.ref_pattern = ref_pattern
         self.reason = reason
 
+    def __str__(self) -> str:
+        return (
+            f"x-gts-ref validation failed for field '{self.field_path}': {self.reason}"
+        )
+
+
+# Keywords whose value is a map of name -> subschema. Draft-07 "dependencies"
+# also maps names to lists of property names; only its dict entries are walked.
+_SCHEMA_MAP_KEYS = frozenset(
+    {
+        "properties",
+        "patternProperties",
+        "$defs",
+        "definitions",
+        "dependentSchemas",
+        "dependencies",
+    }
+)
+# Keywords validate_schema descends into: the maps above plus keywords whose
+# value is a subschema or a list of subschemas
+_SCHEMA_CHILD_KEYS = _SCHEMA_MAP_KEYS | frozenset(
+    {
+        "items",
+        "prefixItems",
+        "additionalItems",
+        "additionalProperties",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+        "contains",
+        "propertyNames",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "then",
+        "else",
+    }
+)
+
+# Exact type -> the container/str type the walk cares about (None: neither).
+# One dict lookup per instance node replaces a chain of isinstance calls;
+# subclasses miss the table and fall back to _json_type.
+_JSON_TYPES: Dict[type, Optional[type]] = {
+    str: str,
+    dict: dict,
+    list: list,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+_UNKNOWN_TYPE = object()
+
+
+def _json_type(inst: Any) -> Optional[type]:
+    """isinstance-based fallback for types not in _JSON_TYPES."""
+    if isinstance(inst, str):
+        return str
+    if isinstance(inst, dict):
+        return dict
+    if isinstance(inst, list):
+        return list
+    return None
+
+
+def _pattern_mismatch(value: str, pattern: str) -> Optional[str]:
+    """Return why value isn't a GTS ID matching pattern, or None if it is."""
+    # Validate it's a valid GTS ID
+    if not _is_valid_gts_id(value):
+        return f"Value '{value}' is not a valid GTS identifier"
+
+    # Check pattern match; "gts.*" matches any valid GTS ID
+    kind, prefix = _pattern_kind(pattern)
+    if kind != _PATTERN_ANY and not value.startswith(prefix):
+        return f"Value '{value}' does not match pattern '{pattern}'"
+    return None
+
+
+def _format_path(path: Any) -> Any:
+    """Join a (parent, segment, is_index) path chain into "a.b[0].c" form."""
+    segments = []
+    while isinstance(path, tuple):
+        path, segment, is_index = path
+        segments.append((segment, is_index))
+    for segment, is_index in reversed(segments):
+        if is_index:
+            path = f"{path}[{segment}]"
+        else:
+            path = f"{path}.{segment}" if path else segment
+    return path
+
+
+# One compiled schema node; the kind bits say which other fields are set
+_Node = namedtuple("_Node", "kind ref props items")
+
 
 class XGtsRefValidator:
     """Validator for x-gts-ref constraints in GTS schemas."""
@@ -40,6 +223,113 @@ class XGtsRefValidator:
             store: Optional GtsStore for resolving entity references
         """
         self.store = store
+        # id(schema) -> (schema, root _Node); the schema is kept so its id stays
+        # unique. A schema mutated after it was validated against must be
+        # passed to invalidate() first.
+        self._compiled: Dict[int, Tuple[Dict[str, Any], Optional[_Node]]] = {}
+        # (value, pattern) -> mismatch reason; only used without a store, since
+        # entity existence can change
+        self._check_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # pointer -> resolved value within _pointer_root; reset whenever a
+        # different root schema is resolved against
+        self._pointer_root: Optional[Dict[str, Any]] = None
+        self._pointer_cache: Dict[str, Optional[str]] = {}
+
+    def _compile(self, sch: Any, root: Dict[str, Any]) -> Optional[_Node]:
+        """
+        Compile a schema node into a _Node.
+
+        Returns None when neither the node nor anything below it has an
+        x-gts-ref, so the walk never descends into instance branches that
+        can't produce errors. A "properties" value that is not a dict is
+        skipped; it is a schema error, left to jsonschema to report.
+        """
+        if not isinstance(sch, dict):
+            return None
+
+        kind = 0
+        ref = props = items = None
+        if "x-gts-ref" in sch:
+            kind |= _HAS_REF
+            ref = self._compile_ref(sch["x-gts-ref"], root)
+
+        if sch.get("type") == "object" and isinstance(sch.get("properties"), dict):
+            compiled_props = []
+            for prop_name, prop_schema in sch["properties"].items():
+                child = self._compile(prop_schema, root)
+                if child is not None:
+                    compiled_props.append((prop_name, child))
+            if compiled_props:
+                kind |= _HAS_PROPS
+                props = tuple(compiled_props)
+
+        if sch.get("type") == "array" and "items" in sch:
+            items = self._compile(sch["items"], root)
+            if items is not None:
+                if items.kind == _HAS_REF and items.ref[0] == OP_CHECK_REF:
+                    kind |= _ITEMS_REF
+                    items = items.ref[1]
+                else:
+                    kind |= _HAS_ITEMS
+
+        if not kind:
+            return None
+        return _Node(kind, ref, props, items)
+
+    def _compile_ref(self, ref_pattern: Any, root: Dict[str, Any]) -> Tuple[int, Any]:
+        """Compile an x-gts-ref value, resolving relative pointers against root."""
+        if not isinstance(ref_pattern, str):
+            return (OP_CHECK_REF_DYN, ref_pattern)
+        if not ref_pattern.startswith("/"):
+            return (OP_CHECK_REF, ref_pattern)
+
+        try:
+            resolved = self._resolve_pointer(root, ref_pattern, set())
+        except _PointerCycle:
+            return (OP_CHECK_REF_DYN, ref_pattern)
+        if resolved is None:
+            return (
+                OP_REF_ERROR,
+                (ref_pattern, f"Cannot resolve reference path '{ref_pattern}'"),
+            )
+        if not resolved.startswith(GTS_PREFIX):
+            return (
+                OP_REF_ERROR,
+                (
+                    ref_pattern,
+                    f"Resolved reference '{ref_pattern}' -> '{resolved}' is not a GTS pattern",
+                ),
+            )
+        return (OP_CHECK_REF, resolved)
+
+    def invalidate(self, schema: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Forget what was compiled or resolved for a schema.
+
+        Args:
+            schema: The schema that changed; None forgets every schema
+        """
+        if schema is None:
+            self._compiled.clear()
+            self._pointer_root = None
+            self._pointer_cache = {}
+            return
+        entry = self._compiled.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            del self._compiled[id(schema)]
+        if schema is self._pointer_root:
+            self._pointer_root = None
+            self._pointer_cache = {}
+
+    def _compiled_root(self, schema: Dict[str, Any]) -> Optional[_Node]:
+        """Return the compiled _Node of a root schema, compiling it once."""
+        entry = self._compiled.get(id(schema))
+        if entry is None:
+            if len(self._compiled) >= _COMPILED_CACHE_MAX:
+                self._compiled.pop(next(iter(self._compiled)))
+            entry = (schema, self._compile(schema, schema))
+            self._compiled[id(schema)] = entry
+        return entry[1]
 
     def validate_instance(
         self, instance: Dict[str, Any], schema: Dict[str, Any], instance_path: str = ""
@@ -55,36 +345,145 @@ class XGtsRefValidator:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        errors: List[XGtsRefValidationError] = []
+        self._walk_instance(instance, schema, instance_path, errors)
+        return errors
 
-        def visit_instance(inst, sch, path):
-            """Visit instance nodes and validate x-gts-ref constraints."""
-            if not isinstance(sch, dict):
-                return
+    def validate_batch(
+        self, instances: Iterable[Any], schema: Dict[str, Any]
+    ) -> List[List[XGtsRefValidationError]]:
+        """
+        Validate many instances against the same schema.
 
-            # Check for x-gts-ref constraint
-            if "x-gts-ref" in sch and isinstance(inst, str):
-                error = self._validate_ref_value(inst, sch["x-gts-ref"], path, schema)
-                if error:
-                    errors.append(error)
-
-            # Recurse into object properties
-            if sch.get("type") == "object" and "properties" in sch:
-                if isinstance(inst, dict):
-                    for prop_name, prop_schema in sch["properties"].items():
-                        if prop_name in inst:
-                            prop_path = f"{path}.{prop_name}" if path else prop_name
-                            visit_instance(inst[prop_name], prop_schema, prop_path)
-
-            # Recurse into array items
-            if sch.get("type") == "array" and "items" in sch:
-                if isinstance(inst, list):
-                    for idx, item in enumerate(inst):
-                        item_path = f"{path}[{idx}]"
-                        visit_instance(item, sch["items"], item_path)
+        The schema is compiled once and, without a store, repeated
+        (value, pattern) pairs across instances are checked only once.
 
-        visit_instance(instance, schema, instance_path)
-        return errors
+        Args:
+            instances: The data instances to validate
+            schema: The JSON schema with x-gts-ref extensions
+
+        Returns:
+            One error list per instance, in input order
+        """
+        results: List[List[XGtsRefValidationError]] = []
+        walk = self._walk_instance
+        for instance in instances:
+            errors: List[XGtsRefValidationError] = []
+            walk(instance, schema, "", errors)
+            results.append(errors)
+        return results
+
+    def is_valid(self, instance: Any, schema: Dict[str, Any]) -> bool:
+        """
+        Check an instance against x-gts-ref constraints in schema.
+
+        Unlike validate_instance, stops at the first failure and creates no
+        error objects.
+
+        Args:
+            instance: The data instance to validate
+            schema: The JSON schema with x-gts-ref extensions
+
+        Returns:
+            True if the instance satisfies every x-gts-ref constraint
+        """
+        return self._walk_instance(instance, schema, "", None)
+
+    def _walk_instance(
+        self,
+        instance: Any,
+        schema: Dict[str, Any],
+        instance_path: str,
+        errors: Optional[List[XGtsRefValidationError]],
+    ) -> bool:
+        """
+        Walk an instance along the compiled schema.
+
+        Errors are appended to errors; when errors is None the walk returns
+        False at the first failure instead.
+
+        Returns:
+            True if no x-gts-ref constraint failed
+        """
+        node = self._compiled_root(schema)
+        if node is None:
+            return True
+
+        # Explicit stack instead of recursion. A node's x-gts-ref check runs
+        # before its children are pushed, and children are pushed in reverse
+        # so they pop in schema order. Paths are kept as (parent, segment,
+        # is_index) links and only formatted when an error needs them.
+        stack: List[Tuple[_Node, Any, Any]] = [(node, instance, instance_path)]
+        # Bound methods hoisted out of the loop
+        errors_append = errors.append if errors is not None else None
+        stack_pop = stack.pop
+        stack_append = stack.append
+        stack_extend = stack.extend
+        mismatch = self._gts_pattern_mismatch
+        while stack:
+            node, inst, path = stack_pop()
+            kind = node.kind
+            base = _JSON_TYPES.get(type(inst), _UNKNOWN_TYPE)
+            if base is _UNKNOWN_TYPE:
+                base = _json_type(inst)
+            if kind & _HAS_REF and base is str:
+                op, arg = node.ref
+                if op == OP_CHECK_REF:
+                    reason = mismatch(inst, arg)
+                    if reason is not None:
+                        if errors_append is None:
+                            return False
+                        errors_append(
+                            XGtsRefValidationError(
+                                _format_path(path), inst, arg, reason
+                            )
+                        )
+                elif op == OP_REF_ERROR:
+                    if errors_append is None:
+                        return False
+                    errors_append(
+                        XGtsRefValidationError(_format_path(path), inst, *arg)
+                    )
+                else:
+                    error = self._validate_ref_value(
+                        inst, arg, _format_path(path), schema
+                    )
+                    if error:
+                        if errors_append is None:
+                            return False
+                        errors_append(error)
+            if kind & _HAS_PROPS:
+                if base is dict:
+                    children = [
+                        (child, inst[name], (path, name, False))
+                        for name, child in node.props
+                        if name in inst
+                    ]
+                    children.reverse()
+                    stack_extend(children)
+            elif kind & _HAS_ITEMS:
+                if base is list:
+                    child = node.items
+                    for idx in range(len(inst) - 1, -1, -1):
+                        stack_append((child, inst[idx], (path, idx, True)))
+            elif kind & _ITEMS_REF:
+                if base is list:
+                    pattern = node.items
+                    for idx, item in enumerate(inst):
+                        if type(item) is str or isinstance(item, str):
+                            reason = mismatch(item, pattern)
+                            if reason is not None:
+                                if errors_append is None:
+                                    return False
+                                errors_append(
+                                    XGtsRefValidationError(
+                                        _format_path((path, idx, True)),
+                                        item,
+                                        pattern,
+                                        reason,
+                                    )
+                                )
+        return not errors
 
     def validate_schema(
         self,
@@ -108,10 +507,13 @@ class XGtsRefValidator:
 
         errors = []
 
-        def visit_schema(sch, path):
-            """Recursively visit schema nodes."""
-            if not isinstance(sch, dict):
-                return
+        # Pre-order walk with an explicit stack; children are pushed in
+        # reverse so they are visited in key order.
+        stack = [(schema, schema_path)] if isinstance(schema, dict) else []
+        errors_append = errors.append
+        stack_pop = stack.pop
+        while stack:
+            sch, path = stack_pop()
 
             # Check for x-gts-ref field
             if "x-gts-ref" in sch:
@@ -119,21 +521,30 @@ class XGtsRefValidator:
                 ref_path = f"{path}/x-gts-ref" if path else "x-gts-ref"
                 error = self._validate_ref_pattern(ref_value, ref_path, root_schema)
                 if error:
-                    errors.append(error)
+                    errors_append(error)
 
-            # Recurse into nested structures
+            # Queue nested subschemas; other keywords ("enum", "default",
+            # "examples", ...) hold data, not schemas, and are not walked
+            children = []
             for key, value in sch.items():
-                if key == "x-gts-ref":
+                if key not in _SCHEMA_CHILD_KEYS:
                     continue
                 nested_path = f"{path}/{key}" if path else key
-                if isinstance(value, dict):
-                    visit_schema(value, nested_path)
+                if key in _SCHEMA_MAP_KEYS:
+                    if isinstance(value, dict):
+                        for name, sub in value.items():
+                            if isinstance(sub, dict):
+                                children.append((sub, f"{nested_path}/{name}"))
+                elif isinstance(value, dict):
+                    children.append((value, nested_path))
                 elif isinstance(value, list):
                     for idx, item in enumerate(value):
                         if isinstance(item, dict):
-                            visit_schema(item, f"{nested_path}[{idx}]")
+                            children.append((item, f"{nested_path}[{idx}]"))
+            if children:
+                children.reverse()
+                stack.extend(children)
 
-        visit_schema(schema, schema_path)
         return errors
 
     def _validate_ref_value(
@@ -161,7 +572,7 @@ class XGtsRefValidator:
 
         # Resolve pattern if it's a relative reference
         if ref_pattern.startswith("/"):
-            resolved_pattern = self._resolve_pointer(schema, ref_pattern)
+            resolved_pattern = self._resolve_cached(schema, ref_pattern)
             if resolved_pattern is None:
                 return XGtsRefValidationError(
                     field_path,
@@ -170,7 +581,7 @@ class XGtsRefValidator:
                     f"Cannot resolve reference path '{ref_pattern}'",
                 )
             if not isinstance(resolved_pattern, str) or not resolved_pattern.startswith(
-                "gts."
+                GTS_PREFIX
             ):
                 return XGtsRefValidationError(
                     field_path,
@@ -206,12 +617,12 @@ class XGtsRefValidator:
             )
 
         # Case 1: Absolute GTS pattern
-        if ref_pattern.startswith("gts."):
+        if ref_pattern.startswith(GTS_PREFIX):
             return self._validate_gts_id_or_pattern(ref_pattern, field_path)
 
         # Case 2: Relative reference
         if ref_pattern.startswith("/"):
-            resolved = self._resolve_pointer(root_schema, ref_pattern)
+            resolved = self._resolve_cached(root_schema, ref_pattern)
             if resolved is None:
                 return XGtsRefValidationError(
                     field_path,
@@ -219,7 +630,7 @@ class XGtsRefValidator:
                     ref_pattern,
                     f"Cannot resolve reference path '{ref_pattern}'",
                 )
-            if not isinstance(resolved, str) or not GtsID.is_valid(resolved):
+            if not isinstance(resolved, str) or not _is_valid_gts_id(resolved):
                 return XGtsRefValidationError(
                     field_path,
                     ref_pattern,
@@ -239,13 +650,13 @@ class XGtsRefValidator:
         self, pattern: str, field_path: str
     ) -> Optional[XGtsRefValidationError]:
         """Validate a GTS ID or pattern in schema definition."""
-        if pattern == "gts.*":
+        if pattern == _GTS_WILDCARD:
             return None  # Valid wildcard
 
         if "*" in pattern:
             # Wildcard pattern - validate prefix
             prefix = pattern.rstrip("*")
-            if not prefix.startswith("gts."):
+            if not prefix.startswith(GTS_PREFIX):
                 return XGtsRefValidationError(
                     field_path,
                     pattern,
@@ -255,7 +666,7 @@ class XGtsRefValidator:
             return None
 
         # Specific GTS ID
-        if not GtsID.is_valid(pattern):
+        if not _is_valid_gts_id(pattern):
             return XGtsRefValidationError(
                 field_path, pattern, pattern, f"Invalid GTS identifier: {pattern}"
             )
@@ -275,47 +686,29 @@ class XGtsRefValidator:
         Returns:
             Error if validation fails, None otherwise
         """
-        # Validate it's a valid GTS ID
-        if not GtsID.is_valid(value):
-            return XGtsRefValidationError(
-                field_path,
-                value,
-                pattern,
-                f"Value '{value}' is not a valid GTS identifier",
-            )
-
-        # Check pattern match
-        if pattern == "gts.*":
-            pass  # Any valid GTS ID matches
-        elif pattern.endswith("*"):
-            prefix = pattern[:-1]
-            if not value.startswith(prefix):
-                return XGtsRefValidationError(
-                    field_path,
-                    value,
-                    pattern,
-                    f"Value '{value}' does not match pattern '{pattern}'",
-                )
-        elif not value.startswith(pattern):
-            return XGtsRefValidationError(
-                field_path,
-                value,
-                pattern,
-                f"Value '{value}' does not match pattern '{pattern}'",
-            )
+        reason = self._gts_pattern_mismatch(value, pattern)
+        if reason is None:
+            return None
+        return XGtsRefValidationError(field_path, value, pattern, reason)
 
-        # Optionally check if entity exists in store
+    def _gts_pattern_mismatch(self, value: str, pattern: str) -> Optional[str]:
+        """Return why value doesn't match a GTS pattern, or None if it does."""
         if self.store:
-            entity = self.store.get(value)
-            if not entity:
-                return XGtsRefValidationError(
-                    field_path,
-                    value,
-                    pattern,
-                    f"Referenced entity '{value}' not found in registry",
-                )
-
-        return None
+            reason = _pattern_mismatch(value, pattern)
+            # Optionally check if entity exists in store
+            if reason is None and not self.store.get(value):
+                reason = f"Referenced entity '{value}' not found in registry"
+            return reason
+
+        # Without a store the result depends only on (value, pattern)
+        key = (value, pattern)
+        reason = self._check_cache.get(key, _UNCHECKED)
+        if reason is _UNCHECKED:
+            reason = _pattern_mismatch(value, pattern)
+            if len(self._check_cache) >= _CHECK_CACHE_MAX:
+                self._check_cache.pop(next(iter(self._check_cache)))
+            self._check_cache[key] = reason
+        return reason
 
     def _normalize_gts_value(self, value: str) -> str:
         """Strip gts:// URI prefix if present."""
@@ -323,23 +716,41 @@ class XGtsRefValidator:
             return value[len(GTS_URI_PREFIX) :]
         return value
 
-    def _resolve_pointer(self, schema: Dict[str, Any], pointer: str) -> Optional[str]:
+    def _resolve_cached(self, schema: Dict[str, Any], pointer: str) -> Optional[str]:
+        """_resolve_pointer, memoized per root schema."""
+        if schema is not self._pointer_root:
+            self._pointer_root = schema
+            self._pointer_cache = {}
+        cache = self._pointer_cache
+        if pointer in cache:
+            return cache[pointer]
+        resolved = cache[pointer] = self._resolve_pointer(schema, pointer)
+        return resolved
+
+    def _resolve_pointer(
+        self, schema: Dict[str, Any], pointer: str, seen: Optional[set] = None
+    ) -> Optional[str]:
         """
         Resolve a JSON Pointer in the schema.
 
         Args:
             schema: The schema to search
             pointer: JSON Pointer (e.g., "/$id", "/properties/type")
+            seen: Pointers already followed; when given, a pointer chain that
+                loops raises _PointerCycle instead of recursing forever
 
         Returns:
             The resolved value or None if not found
         """
+        if seen is not None:
+            if pointer in seen:
+                raise _PointerCycle(pointer)
+            seen.add(pointer)
 
-        path = pointer.lstrip("/")
-        if not path:
+        parts = _pointer_parts(pointer)
+        if not parts:
             return None
 
-        parts = path.split("/")
         current = schema
 
         for part in parts:
@@ -358,7 +769,7 @@ class XGtsRefValidator:
             ref_value = current["x-gts-ref"]
             if isinstance(ref_value, str):
                 if ref_value.startswith("/"):
-                    return self._resolve_pointer(schema, ref_value)
+                    return self._resolve_pointer(schema, ref_value, seen)
                 return self._normalize_gts_value(ref_value)
 
         return None
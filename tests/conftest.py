@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+
+def pytest_configure(config):
+    # pytest-codspeed measures tests carrying this marker when run with
+    # --codspeed; registered here too so plain runs don't warn about it
+    config.addinivalue_line(
+        "markers", "benchmark: test body is tracked as a pytest-codspeed benchmark"
+    )
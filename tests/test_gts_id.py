@@ -218,6 +218,35 @@ class TestGtsWildcard:
         pattern = GtsWildcard("gts.vendor.package.namespace.type.v1~")
         assert gts_id.wildcard_match(pattern) is True
 
+    def test_match_segments_agrees_with_wildcard_match(self):
+        """Test matching pre-parsed segments against a wildcard."""
+        gts_id = GtsID("gts.vendor.package.namespace.type.v1.5~vendor.app.ns.item.v1")
+        for expr in (
+            "gts.vendor.package.*",
+            "gts.vendor.package.namespace.type.v1~*",
+            "gts.vendor.package.namespace.type.v1~vendor.app.*",
+            "gts.vendor.package.namespace.type.v2~*",
+            "gts.other.*",
+        ):
+            pattern = GtsWildcard(expr)
+            assert pattern.match_segments(
+                gts_id.gts_id_segments
+            ) is gts_id.wildcard_match(pattern)
+            assert pattern.match(gts_id) is gts_id.wildcard_match(pattern)
+
+    def test_wildcard_prefix_only_for_name_tokens(self):
+        """Test only name-token wildcards match by plain prefix."""
+        assert GtsWildcard("gts.*").prefix == "gts."
+        assert GtsWildcard("gts.vendor.package.*").prefix == "gts.vendor.package."
+        # Version tokens and chained segments keep version-flexible matching
+        assert GtsWildcard("gts.vendor.package.namespace.type.v1.*").prefix is None
+        assert GtsWildcard("gts.vendor.package.namespace.type.v1~*").prefix is None
+
+        gts_id = GtsID("gts.vendor.package.namespace.type.v1~")
+        assert gts_id.wildcard_match(
+            GtsWildcard("gts.vendor.package.namespace.type.v1.*")
+        )
+
 
 class TestGtsIDEdgeCases:
     """Edge case tests for GTS IDs."""
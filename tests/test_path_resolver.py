@@ -1,5 +1,7 @@
 """Tests for GtsPathResolver."""
 
+from dataclasses import asdict, fields
+
 from gts.path_resolver import GtsPathResolver
 
 
@@ -52,6 +54,35 @@ class TestGtsPathResolverBasic:
         assert result.resolved is True
         assert result.value == "bob"
 
+    def test_resolve_repeated_paths_on_one_resolver(self):
+        """Test one resolver answers repeated and interleaved paths correctly."""
+        content = {"a": {"b": [10, 20]}, "c": "x"}
+        resolver = GtsPathResolver("gts.test~", content)
+
+        for _ in range(2):
+            assert resolver.resolve("a.b[1]").value == 20
+            assert resolver.resolve("c").value == "x"
+            assert resolver.resolve("a.b[5]").resolved is False
+        assert resolver == GtsPathResolver("gts.test~", content).resolve("a.b[5]")
+
+    def test_dataclass_fields_are_the_public_ones(self):
+        """Test fields() and asdict() expose only the public result fields."""
+        resolver = GtsPathResolver("gts.test~", {"a": 1})
+        resolver.resolve("a")
+        resolver.resolve("b")
+        names = [
+            "gts_id",
+            "content",
+            "path",
+            "value",
+            "resolved",
+            "error",
+            "available_fields",
+        ]
+
+        assert [f.name for f in fields(resolver)] == names
+        assert list(asdict(resolver)) == names
+
 
 class TestGtsPathResolverSlashSyntax:
     """Test slash-based path syntax."""
@@ -151,6 +182,27 @@ class TestGtsPathResolverAvailableFields:
         assert "[1]" in result.available_fields
         assert "[2]" in result.available_fields
 
+    def test_available_fields_reset_by_next_resolve(self):
+        """Test a successful resolve clears fields left by a failed one."""
+        content = {"name": "test", "nested": {"inner": "value"}}
+        resolver = GtsPathResolver("gts.test~", content)
+
+        assert resolver.resolve("missing").resolved is False
+        assert resolver.resolve("nested.inner").available_fields == []
+        assert resolver.resolve("nested.missing").available_fields == ["inner"]
+
+    def test_available_fields_is_plain_ordered_list(self):
+        """Test available_fields is a plain list of paths in traversal order."""
+        content = {"b": {"x": 1}, "a": [1]}
+        resolver = GtsPathResolver("gts.test~", content)
+        result = resolver.resolve("missing")
+
+        assert "b.x" in result.available_fields
+        assert "missing" not in result.available_fields
+        assert result.available_fields == ["b", "b.x", "a", "a[0]"]
+        assert type(result.available_fields) is list
+        assert result.to_dict()["available_fields"] == ["b", "b.x", "a", "a[0]"]
+
 
 class TestGtsPathResolverToDict:
     """Tests for to_dict() method."""
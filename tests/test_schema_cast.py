@@ -0,0 +1,180 @@
+"""Tests for GtsEntityCastResult."""
+
+import copy
+import datetime
+import math
+
+import pytest
+from referencing import Registry, Resource
+from referencing.exceptions import Unresolvable
+
+from gts import schema_cast
+from gts.schema_cast import GtsEntityCastResult, clear_validator_cache
+
+
+SCHEMA_ID = "gts.vendor.package.namespace.type.v1.0~"
+INSTANCE_ID = SCHEMA_ID + "vendor.package.namespace.instance.v1.0"
+
+SCHEMA = {
+    "$id": "gts://" + SCHEMA_ID,
+    "type": "object",
+    "properties": {"name": {"type": "string"}},
+}
+
+
+def _cast(content):
+    return GtsEntityCastResult.cast(INSTANCE_ID, SCHEMA_ID, content, SCHEMA, SCHEMA)
+
+
+class TestCastInstanceCopy:
+    """Tests that cast() copies the instance without changing its values."""
+
+    def test_plain_json_is_copied(self):
+        """Test a plain JSON instance is copied, not aliased."""
+        content = {"name": "a", "tags": ["x"], "meta": {"n": 1, "f": 1.5}}
+
+        casted = _cast(content).casted_entity
+
+        assert casted == content
+        assert casted is not content
+        assert casted["tags"] is not content["tags"]
+        assert casted["meta"] is not content["meta"]
+
+    def test_nan_is_preserved(self):
+        """Test a NaN value stays NaN instead of turning into None."""
+        casted = _cast({"name": "a", "score": float("nan")}).casted_entity
+
+        assert isinstance(casted["score"], float)
+        assert math.isnan(casted["score"])
+
+    def test_date_is_preserved(self):
+        """Test a date value keeps its type instead of becoming a string."""
+        when = datetime.date(2024, 1, 2)
+
+        casted = _cast({"name": "a", "when": when}).casted_entity
+
+        assert casted["when"] == when
+        assert type(casted["when"]) is datetime.date
+
+    def test_tuple_is_preserved(self):
+        """Test a tuple value stays a tuple instead of becoming a list."""
+        casted = _cast({"name": "a", "pair": (1, 2)}).casted_entity
+
+        assert casted["pair"] == (1, 2)
+        assert type(casted["pair"]) is tuple
+
+    def test_big_int_is_preserved(self):
+        """Test an int wider than 64 bits is copied unchanged."""
+        big = 2**70
+
+        casted = _cast({"name": "a", "n": [big]}).casted_entity
+
+        assert casted["n"] == [big]
+
+
+class TestSchemaChangedInPlace:
+    """Tests that casts see schema edits made in place between calls."""
+
+    def test_compatibility_follows_in_place_edit(self):
+        """Test a schema edited in place is re-checked for compatibility."""
+        old = {"type": "object", "properties": {"a": {"type": "string"}}}
+        new = {"type": "object", "properties": {"a": {"type": "string"}}}
+
+        first = GtsEntityCastResult.cast(INSTANCE_ID, SCHEMA_ID, {"a": "x"}, old, new)
+        new["properties"]["a"]["type"] = "integer"
+        new["required"] = ["a"]
+        second = GtsEntityCastResult.cast(INSTANCE_ID, SCHEMA_ID, {"a": "x"}, old, new)
+
+        assert first.is_backward_compatible is True
+        assert second.is_backward_compatible is False
+        assert "Property 'a' type changed from string to integer" in (
+            second.backward_errors
+        )
+
+    def test_validation_follows_in_place_edit(self):
+        """Test a target schema edited in place validates with its new content."""
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+
+        first = GtsEntityCastResult.cast(
+            INSTANCE_ID, SCHEMA_ID, {"a": "x"}, schema, schema
+        )
+        schema["properties"]["a"]["type"] = "integer"
+        second = GtsEntityCastResult.cast(
+            INSTANCE_ID, SCHEMA_ID, {"a": "x"}, schema, schema
+        )
+
+        assert first.is_fully_compatible is True
+        assert second.is_fully_compatible is False
+        assert second.incompatibility_reasons == ["'x' is not of type 'integer'"]
+
+
+def _count_validator_builds(monkeypatch):
+    """Count target schema validator builds by wrapping validator_for()."""
+    calls = []
+    original = schema_cast.validator_for
+
+    def wrapper(schema, *args, **kwargs):
+        calls.append(schema)
+        return original(schema, *args, **kwargs)
+
+    monkeypatch.setattr(schema_cast, "validator_for", wrapper)
+    return calls
+
+
+class TestValidatorCache:
+    """Tests for the target schema validator cache."""
+
+    def test_reconstructed_schema_reuses_validator(self, monkeypatch):
+        """Test equal schema content reuses one validator across schema objects."""
+        calls = _count_validator_builds(monkeypatch)
+        schema = {"type": "object", "properties": {"b": {"type": "string"}}}
+
+        for target in (schema, copy.deepcopy(schema), copy.deepcopy(schema)):
+            result = GtsEntityCastResult.cast(
+                INSTANCE_ID, SCHEMA_ID, {"b": "x"}, target, target
+            )
+            assert result.is_fully_compatible is True
+
+        assert len(calls) == 1
+
+    def test_resolver_is_not_stale(self, monkeypatch):
+        """Test the bound validator follows the resolver passed to each call."""
+        calls = _count_validator_builds(monkeypatch)
+        ref_id = "gts://gts.vendor.package.namespace.name.v1.0~"
+        target = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "gts://" + SCHEMA_ID,
+            "type": "object",
+            "properties": {"name": {"$ref": ref_id}},
+        }
+        resource = Resource.from_contents(
+            {"$schema": "http://json-schema.org/draft-07/schema#", "type": "string"}
+        )
+        with_ref = Registry().with_resource(ref_id, resource)
+
+        ok = GtsEntityCastResult.cast(
+            INSTANCE_ID, SCHEMA_ID, {"name": "a"}, target, target, with_ref
+        )
+        bad = GtsEntityCastResult.cast(
+            INSTANCE_ID, SCHEMA_ID, {"name": 1}, target, target, with_ref
+        )
+        assert ok.is_fully_compatible is True
+        assert bad.is_fully_compatible is False
+
+        with pytest.raises(Unresolvable):
+            GtsEntityCastResult.cast(
+                INSTANCE_ID, SCHEMA_ID, {"name": "a"}, target, target, Registry()
+            )
+        assert len(calls) == 1
+
+    def test_clear_validator_cache(self, monkeypatch):
+        """Test clear_validator_cache() forces the validator to be rebuilt."""
+        calls = _count_validator_builds(monkeypatch)
+        schema = {"type": "object", "properties": {"c": {"type": "string"}}}
+
+        for clear in (False, True):
+            if clear:
+                clear_validator_cache()
+            GtsEntityCastResult.cast(INSTANCE_ID, SCHEMA_ID, {"c": "x"}, schema, schema)
+
+        assert len(calls) == 2
@@ -0,0 +1,219 @@
+"""Tests for GtsHttpServer."""
+
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gts.ops import GtsOps
+from gts.server import GtsHttpServer, _FastJSONResponse
+
+
+INSTANCE_ID = (
+    "gts.vendor.package.namespace.type.v1.0~vendor.package.namespace.instance.v1.0"
+)
+
+
+def _client(verbose=0):
+    return TestClient(GtsHttpServer(ops=GtsOps(verbose=verbose)).app)
+
+
+class TestJsonRendering:
+    """Tests for how response bodies are rendered."""
+
+    def test_big_int_is_rendered(self):
+        """Test an int wider than 64 bits renders instead of failing with a 500."""
+        client = _client()
+        big = 2**70
+        added = client.post("/entities", json={"id": INSTANCE_ID, "count": big})
+        assert added.status_code == 200
+
+        response = client.get(f"/entities/{INSTANCE_ID}")
+
+        assert response.status_code == 200
+        assert response.json()["content"]["count"] == big
+
+    def test_nan_is_rejected(self):
+        """Test a NaN is rejected like the stock JSONResponse, not sent as null."""
+        with pytest.raises(ValueError):
+            _FastJSONResponse({"score": [1.0, float("nan")]})
+
+    def test_finite_floats_are_rendered(self):
+        """Test the NaN check does not reject plain nulls next to finite floats."""
+        response = _FastJSONResponse({"score": 1.5, "other": None})
+
+        assert json.loads(response.body) == {"score": 1.5, "other": None}
+
+
+class TestRequestLogging:
+    """Tests for body logging at verbose level 2."""
+
+    def test_streamed_request_body_is_logged(self, caplog):
+        """Test a request body sent in several chunks is logged whole."""
+        caplog.set_level(logging.DEBUG)
+        client = _client(verbose=2)
+
+        def chunks():
+            yield b'{"id": "gts.vendor.package.namespace.type.v1.0~'
+            yield b'vendor.package.namespace.instance.v1.0"}'
+
+        response = client.post(
+            "/extract-id",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        assert "POST /extract-id" in caplog.text
+        assert f'"id": "{INSTANCE_ID}"' in caplog.text
+        assert '"schema_id": "gts.vendor.package.namespace.type.v1.0~"' in caplog.text
+
+    def test_large_request_body_is_truncated(self, caplog):
+        """Test a body over the size limit is logged as a truncated prefix."""
+        caplog.set_level(logging.DEBUG)
+        client = _client(verbose=2)
+        body = json.dumps({"id": INSTANCE_ID, "pad": "x" * 5000}).encode()
+
+        response = client.post(
+            "/extract-id", content=body, headers={"content-type": "application/json"}
+        )
+
+        assert response.status_code == 200
+        assert f"Request body ({len(body)} bytes, truncated)" in caplog.text
+        assert "x" * 5000 not in caplog.text
+
+    def test_bodies_not_logged_at_verbose_1(self, caplog):
+        """Test only the summary line is logged at verbose level 1."""
+        caplog.set_level(logging.DEBUG)
+        client = _client(verbose=1)
+
+        client.post("/extract-id", json={"id": INSTANCE_ID})
+
+        assert "POST /extract-id" in caplog.text
+        assert "Request body" not in caplog.text
+        assert "Response body" not in caplog.text
+
+
+class TestInvalidBodies:
+    """Tests for 422 responses to malformed request bodies."""
+
+    @pytest.mark.parametrize("path", ["/cast", "/validate-instance", "/schemas"])
+    def test_malformed_json(self, path):
+        """Test a body that is not JSON is rejected with json_invalid."""
+        response = _client().post(
+            path, content=b"{bad", headers={"content-type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "json_invalid"
+        assert error["loc"] == ["body"]
+
+    @pytest.mark.parametrize(
+        "path, body, field",
+        [
+            ("/cast", {"instance_id": INSTANCE_ID}, "to_schema_id"),
+            ("/validate-instance", {}, "instance_id"),
+            ("/schemas", {"schema": {}}, "type_id"),
+        ],
+    )
+    def test_missing_field(self, path, body, field):
+        """Test a missing required field is reported by name."""
+        response = _client().post(path, json=body)
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "missing"
+        assert error["loc"] == ["body", field]
+        assert error["input"] == body
+
+    @pytest.mark.parametrize(
+        "path, body, field",
+        [
+            ("/cast", {"instance_id": INSTANCE_ID, "to_schema_id": 1}, "to_schema_id"),
+            ("/validate-instance", {"instance_id": 1}, "instance_id"),
+            ("/schemas", {"type_id": "gts.a.b.c.d.v1~", "schema": []}, "schema"),
+        ],
+    )
+    def test_wrong_field_type(self, path, body, field):
+        """Test a field of the wrong type is reported with its value."""
+        response = _client().post(path, json=body)
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "type_error"
+        assert error["loc"] == ["body", field]
+        assert error["input"] == body[field]
+
+    def test_body_not_an_object(self):
+        """Test a JSON body that is not an object is rejected."""
+        response = _client().post("/cast", json=[INSTANCE_ID])
+
+        assert response.status_code == 422
+        (error,) = response.json()["detail"]
+        assert error["type"] == "type_error"
+        assert error["loc"] == ["body"]
+
+
+class TestCachedIdEndpoints:
+    """Tests that the cached id endpoints answer per argument."""
+
+    def test_validate_id_per_id(self):
+        """Test validate-id results are not shared between different ids."""
+        client = _client()
+
+        for _ in range(2):
+            valid = client.get("/validate-id", params={"gts_id": INSTANCE_ID}).json()
+            invalid = client.get("/validate-id", params={"gts_id": "bad"}).json()
+
+            assert (valid["id"], valid["valid"]) == (INSTANCE_ID, True)
+            assert (invalid["id"], invalid["valid"]) == ("bad", False)
+
+    def test_parse_id_per_id(self):
+        """Test parse-id results are not shared between different ids."""
+        client = _client()
+        schema_id = "gts.vendor.package.namespace.type.v1.0~"
+
+        for _ in range(2):
+            schema = client.get("/parse-id", params={"gts_id": schema_id}).json()
+            instance = client.get("/parse-id", params={"gts_id": INSTANCE_ID}).json()
+
+            assert schema["id"] == schema_id
+            assert schema["is_schema"] is True
+            assert len(schema["segments"]) == 1
+            assert instance["id"] == INSTANCE_ID
+            assert instance["is_schema"] is False
+            assert len(instance["segments"]) == 2
+
+    def test_match_id_pattern_per_pair(self):
+        """Test match results are keyed on both candidate and pattern."""
+        client = _client()
+        pairs = [
+            (INSTANCE_ID, "gts.vendor.*", True),
+            (INSTANCE_ID, "gts.other.*", False),
+            ("gts.other.package.namespace.type.v1~", "gts.vendor.*", False),
+            ("gts.other.package.namespace.type.v1~", "gts.other.*", True),
+        ]
+
+        for _ in range(2):
+            for candidate, pattern, expected in pairs:
+                result = client.get(
+                    "/match-id-pattern",
+                    params={"candidate": candidate, "pattern": pattern},
+                ).json()
+
+                assert result["match"] is expected, (candidate, pattern)
+
+    def test_uuid_per_id(self):
+        """Test uuid results are not shared between different ids."""
+        client = _client()
+        other_id = "gts.vendor.package.namespace.type.v1.0~"
+
+        for _ in range(2):
+            first = client.get("/uuid", params={"gts_id": INSTANCE_ID}).json()
+            second = client.get("/uuid", params={"gts_id": other_id}).json()
+
+            assert first["id"] == INSTANCE_ID
+            assert second["id"] == other_id
+            assert first["uuid"] != second["uuid"]
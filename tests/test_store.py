@@ -19,29 +19,29 @@ from gts.gts import GtsID
 class MockGtsReader(GtsReader):
     """Mock reader for testing."""
 
+    __slots__ = ("_entities", "_by_id")
+
     def __init__(self, entities: list[GtsEntity]):
         self._entities = entities
-        self._index = 0
+        # First entity per id, as the previous linear scan returned
+        self._by_id: dict[str, GtsEntity] = {}
+        for entity in entities:
+            if entity.gts_id:
+                self._by_id.setdefault(entity.gts_id.id, entity)
 
     def __iter__(self) -> Iterator[GtsEntity]:
-        self._index = 0
-        return self
-
-    def __next__(self) -> GtsEntity:
-        if self._index >= len(self._entities):
-            raise StopIteration
-        entity = self._entities[self._index]
-        self._index += 1
-        return entity
+        # Each call starts over, so there is no position to reset
+        return iter(self._entities)
 
     def read_by_id(self, entity_id: str) -> Optional[GtsEntity]:
-        for entity in self._entities:
-            if entity.gts_id and entity.gts_id.id == entity_id:
-                return entity
-        return None
+        return self._by_id.get(entity_id)
 
     def reset(self) -> None:
-        self._index = 0
+        pass
+
+
+# Stateless (every iteration starts over), so one instance serves all tests
+EMPTY_READER = MockGtsReader([])
 
 
 class TestGtsStore:
@@ -49,10 +49,11 @@ class TestGtsStore:
 
     def test_store_creation_empty(self):
         """Test creating empty store."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
         assert store.get("gts.any.id~") is None
 
+    @pytest.mark.benchmark
     def test_store_population_from_reader(self):
         """Test store is populated from reader."""
         gts_id = GtsID("gts.vendor.package.namespace.type.v1~")
@@ -68,9 +69,63 @@ class TestGtsStore:
         assert result is not None
         assert result.content == {"name": "test"}
 
+    def test_store_populates_from_reader_on_first_access(self):
+        """Test the reader is only iterated once the store is used."""
+
+        class CountingReader(MockGtsReader):
+            iterations = 0
+
+            def __iter__(self) -> Iterator[GtsEntity]:
+                self.iterations += 1
+                return super().__iter__()
+
+        schema_id = "gts.vendor.package.namespace.type.v1~"
+        reader = CountingReader(
+            [
+                GtsEntity(
+                    content={"name": "old"}, gts_id=GtsID(schema_id), is_schema=True
+                )
+            ]
+        )
+        store = GtsStore(reader)
+        assert reader.iterations == 0
+
+        # Registering first still lets the registered entity win, as before
+        store.register_schema(schema_id, {"name": "new"})
+        assert reader.iterations == 1
+        assert store.get(schema_id).content == {"name": "new"}
+        assert [key for key, _ in store.items()] == [schema_id]
+        assert reader.iterations == 1
+
+    def test_store_retries_population_after_reader_error(self):
+        """Test a reader that fails once doesn't leave the store empty."""
+
+        class FlakyReader(MockGtsReader):
+            failures = 1
+
+            def __iter__(self) -> Iterator[GtsEntity]:
+                if self.failures:
+                    self.failures -= 1
+                    raise OSError("disk unavailable")
+                return super().__iter__()
+
+        schema_id = "gts.vendor.package.namespace.type.v1~"
+        reader = FlakyReader(
+            [GtsEntity(content={"name": "a"}, gts_id=GtsID(schema_id), is_schema=True)]
+        )
+        store = GtsStore(reader)
+
+        with pytest.raises(OSError):
+            store.get(schema_id)
+
+        # items() only sees what population loaded, unlike get()'s
+        # read_by_id fallback
+        assert [key for key, _ in store.items()] == [schema_id]
+        assert store.get(schema_id).content == {"name": "a"}
+
     def test_store_register_entity(self):
         """Test registering an entity directly."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         gts_id = GtsID("gts.vendor.package.namespace.type.v1~")
@@ -86,7 +141,7 @@ class TestGtsStore:
 
     def test_store_register_schema(self):
         """Test registering a schema."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         schema = {
@@ -101,7 +156,7 @@ class TestGtsStore:
 
     def test_store_register_schema_invalid_id(self):
         """Test registering schema with invalid ID (not ending with ~)."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         with pytest.raises(ValueError) as exc_info:
@@ -124,12 +179,24 @@ class TestGtsStore:
 
     def test_store_get_schema_content_not_found(self):
         """Test getting non-existent schema content raises KeyError."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         with pytest.raises(KeyError):
             store.get_schema_content("gts.vendor.package.namespace.nonexistent.v1~")
 
+    def test_store_get_skips_exhaustive_reader(self):
+        """Test that misses don't fall back to an exhaustive reader."""
+
+        class ExhaustiveReader(MockGtsReader):
+            exhaustive = True
+
+            def read_by_id(self, entity_id: str) -> Optional[GtsEntity]:
+                raise AssertionError("read_by_id should not be called")
+
+        store = GtsStore(ExhaustiveReader([]))
+        assert store.get("gts.vendor.package.namespace.type.v1~") is None
+
     def test_store_items(self):
         """Test iterating over store items."""
         entities = [
@@ -146,43 +213,90 @@ class TestGtsStore:
         assert len(items) == 3
 
 
+def _create_entities():
+    """Helper to create the test entities for query tests."""
+    return [
+        GtsEntity(
+            content={
+                "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.alice.v1",
+                "name": "alice",
+                "status": "active",
+            },
+            cfg=DEFAULT_GTS_CONFIG,
+        ),
+        GtsEntity(
+            content={
+                "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.bob.v1",
+                "name": "bob",
+                "status": "inactive",
+            },
+            cfg=DEFAULT_GTS_CONFIG,
+        ),
+        GtsEntity(
+            content={
+                "$id": "gts.vendor.package.namespace.order.v1~vendor.package.namespace.order1.v1",
+                "orderId": "order1",
+                "status": "active",
+            },
+            cfg=DEFAULT_GTS_CONFIG,
+        ),
+    ]
+
+
+def _create_store_with_entities():
+    """Helper to create a store with test entities."""
+    reader = MockGtsReader(_create_entities())
+    return GtsStore(reader)
+
+
+def _create_store_with_schema_and_instance():
+    """Helper to create store with schema and instance."""
+    schema = GtsEntity(
+        content={
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "gts.vendor.package.namespace.type.v1~",
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+            },
+            "required": ["name"],
+        },
+        cfg=DEFAULT_GTS_CONFIG,
+    )
+
+    instance = GtsEntity(
+        content={
+            "$id": "gts.vendor.package.namespace.type.v1~vendor.package.namespace.inst.v1",
+            "gtsType": "gts.vendor.package.namespace.type.v1~",
+            "name": "test",
+        },
+        cfg=DEFAULT_GTS_CONFIG,
+    )
+
+    reader = MockGtsReader([schema, instance])
+    return GtsStore(reader)
+
+
+# Stores shared by the tests of this module that only read from them; tests
+# that register entities build their own with the helpers above
+@pytest.fixture(scope="module")
+def populated_store():
+    """Read-only store from _create_store_with_entities."""
+    return _create_store_with_entities()
+
+
+@pytest.fixture(scope="module")
+def schema_and_instance_store():
+    """Read-only store from _create_store_with_schema_and_instance."""
+    return _create_store_with_schema_and_instance()
+
+
 class TestGtsStoreQuery:
     """Tests for GtsStore query functionality."""
 
-    def _create_store_with_entities(self):
-        """Helper to create a store with test entities."""
-        entities = [
-            GtsEntity(
-                content={
-                    "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.alice.v1",
-                    "name": "alice",
-                    "status": "active",
-                },
-                cfg=DEFAULT_GTS_CONFIG,
-            ),
-            GtsEntity(
-                content={
-                    "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.bob.v1",
-                    "name": "bob",
-                    "status": "inactive",
-                },
-                cfg=DEFAULT_GTS_CONFIG,
-            ),
-            GtsEntity(
-                content={
-                    "$id": "gts.vendor.package.namespace.order.v1~vendor.package.namespace.order1.v1",
-                    "orderId": "order1",
-                    "status": "active",
-                },
-                cfg=DEFAULT_GTS_CONFIG,
-            ),
-        ]
-        reader = MockGtsReader(entities)
-        return GtsStore(reader)
-
-    def test_query_exact_match(self):
+    def test_query_exact_match(self, populated_store):
         """Test exact match query."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query(
             "gts.vendor.package.namespace.user.v1~vendor.package.namespace.alice.v1"
         )
@@ -191,20 +305,20 @@ class TestGtsStoreQuery:
         assert result.count == 1
         assert result.results[0]["name"] == "alice"
 
-    def test_query_wildcard_match(self):
+    @pytest.mark.benchmark
+    def test_query_wildcard_match(self, populated_store):
         """Test wildcard match query."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query("gts.vendor.package.namespace.user.*")
 
         assert result.error == ""
         assert result.count == 2
-        names = [r["name"] for r in result.results]
-        assert "alice" in names
-        assert "bob" in names
+        assert {r["name"] for r in result.results} == {"alice", "bob"}
 
-    def test_query_with_filter(self):
+    @pytest.mark.benchmark
+    def test_query_with_filter(self, populated_store):
         """Test query with filter."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query("gts.vendor.package.namespace.*[status=active]")
 
         assert result.error == ""
@@ -212,25 +326,116 @@ class TestGtsStoreQuery:
         for r in result.results:
             assert r["status"] == "active"
 
-    def test_query_with_limit(self):
+    def test_query_with_wildcard_filter_value(self, populated_store):
+        """Test that a '*' filter value requires a non-empty field."""
+        store = populated_store
+        result = store.query("gts.vendor.package.namespace.*[name=*]")
+
+        assert result.error == ""
+        assert {r["name"] for r in result.results} == {"alice", "bob"}
+
+    def test_query_with_indexed_filter(self):
+        """Test that filters on indexed fields match like unindexed ones."""
+        reader = MockGtsReader(_create_entities())
+        plain = GtsStore(reader)
+        indexed = GtsStore(reader, indexed_fields=["status"])
+        for expr in (
+            "gts.vendor.package.namespace.*[status=active]",
+            "gts.vendor.package.namespace.*[status=inactive, name=bob]",
+            "gts.vendor.package.namespace.*[status=missing]",
+        ):
+            assert indexed.query(expr).results == plain.query(expr).results
+
+        indexed.register(
+            GtsEntity(
+                content={
+                    "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.bob.v1",
+                    "name": "bob",
+                    "status": "active",
+                },
+                cfg=DEFAULT_GTS_CONFIG,
+            )
+        )
+        result = indexed.query("gts.vendor.package.namespace.*[status=active]")
+        assert [r.get("name", r.get("orderId")) for r in result.results] == [
+            "alice",
+            "bob",
+            "order1",
+        ]
+
+    def test_query_with_indexed_filter_after_reindex(self):
+        """Test reindex() picks up content changed in place on an indexed field."""
+        store = GtsStore(MockGtsReader(_create_entities()), indexed_fields=["status"])
+        alice = store.get(
+            "gts.vendor.package.namespace.user.v1~vendor.package.namespace.alice.v1"
+        )
+        active = "gts.vendor.package.namespace.user.*[status=active]"
+        inactive = "gts.vendor.package.namespace.user.*[status=inactive]"
+        assert [r["name"] for r in store.query(active).results] == ["alice"]
+
+        alice.content["status"] = "inactive"
+        store.reindex()
+
+        assert store.query(active).results == []
+        assert [r["name"] for r in store.query(inactive).results] == ["alice", "bob"]
+
+    def test_query_with_limit(self, populated_store):
         """Test query with limit."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query("gts.vendor.package.namespace.*", limit=1)
 
         assert result.count == 1
         assert result.limit == 1
 
-    def test_query_no_match(self):
+    def test_query_no_match(self, populated_store):
         """Test query with no matches."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query("gts.vendor.other.*")
 
         assert result.error == ""
         assert result.count == 0
 
-    def test_query_invalid_pattern(self):
+    def test_query_wildcard_sees_registered_entities(self):
+        """Test wildcard queries include entities registered after creation."""
+        store = _create_store_with_entities()
+        store.register(
+            GtsEntity(
+                content={
+                    "$id": "gts.vendor.package.namespace.user.v1~vendor.package.namespace.carol.v1",
+                    "name": "carol",
+                },
+                cfg=DEFAULT_GTS_CONFIG,
+            )
+        )
+        store.register(
+            GtsEntity(
+                content={
+                    "$id": "gts.other.package.namespace.user.v1~other.package.namespace.dave.v1",
+                    "name": "dave",
+                },
+                cfg=DEFAULT_GTS_CONFIG,
+            )
+        )
+
+        result = store.query("gts.vendor.package.namespace.user.*")
+        assert [r["name"] for r in result.results] == ["alice", "bob", "carol"]
+        assert store.query("gts.other.*").count == 1
+        assert store.query("gts.*").count == 5
+
+    def test_iter_query(self, populated_store):
+        """Test lazily iterating query matches."""
+        store = populated_store
+        names = [
+            r["name"] for r in store.iter_query("gts.vendor.package.namespace.user.*")
+        ]
+        assert names == ["alice", "bob"]
+
+        with pytest.raises(ValueError):
+            store.iter_query("gts.vendor.package.namespace.user.v1~alice*")
+
+    def test_query_invalid_pattern(self, populated_store):
         """Test query with invalid pattern."""
-        store = self._create_store_with_entities()
+        store = populated_store
         result = store.query("gts.vendor.package.namespace.user.v1~alice*")
 
         assert result.error != ""
@@ -240,42 +445,54 @@ class TestGtsStoreQuery:
 class TestGtsStoreValidation:
     """Tests for GtsStore validation methods."""
 
-    def _create_store_with_schema_and_instance(self):
-        """Helper to create store with schema and instance."""
-        schema = GtsEntity(
-            content={
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "$id": "gts.vendor.package.namespace.type.v1~",
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                },
-                "required": ["name"],
-            },
-            cfg=DEFAULT_GTS_CONFIG,
-        )
-
-        instance = GtsEntity(
-            content={
-                "$id": "gts.vendor.package.namespace.type.v1~vendor.package.namespace.inst.v1",
-                "gtsType": "gts.vendor.package.namespace.type.v1~",
-                "name": "test",
-            },
-            cfg=DEFAULT_GTS_CONFIG,
-        )
-
-        reader = MockGtsReader([schema, instance])
-        return GtsStore(reader)
-
-    def test_validate_schema_valid(self):
+    def test_validate_schema_valid(self, schema_and_instance_store):
         """Test validating a valid schema."""
-        store = self._create_store_with_schema_and_instance()
+        store = schema_and_instance_store
         # Should not raise
         store.validate_schema("gts.vendor.package.namespace.type.v1~")
 
+    def test_validate_schema_checks_only_subschema_refs(self):
+        """Test x-gts-ref checks cover subschemas but not data keywords."""
+        schema_id = "gts.vendor.package.namespace.reftype.v1~"
+        content = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": schema_id,
+            "type": "object",
+            "properties": {"ref": {"type": "string", "x-gts-ref": "gts.*"}},
+            "examples": [{"x-gts-ref": "not-a-pattern"}],
+        }
+        store = GtsStore(EMPTY_READER)
+        store.register(GtsEntity(content=content, cfg=DEFAULT_GTS_CONFIG))
+        store.validate_schema(schema_id)
+
+        content["$defs"] = {"bad": {"x-gts-ref": "not-a-pattern"}}
+        store.register(GtsEntity(content=content, cfg=DEFAULT_GTS_CONFIG))
+        with pytest.raises(Exception) as exc_info:
+            store.validate_schema(schema_id)
+        assert "$defs/bad/x-gts-ref" in str(exc_info.value)
+
+    def test_validate_schema_checks_dependencies_refs(self):
+        """Test x-gts-ref checks cover draft-07 "dependencies" subschemas."""
+        schema_id = "gts.vendor.package.namespace.deptype.v1~"
+        content = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": schema_id,
+            "type": "object",
+            "dependencies": {
+                "a": {"properties": {"b": {"x-gts-ref": "bad"}}},
+                "c": ["a"],
+            },
+        }
+        store = GtsStore(MockGtsReader([]))
+        store.register(GtsEntity(content=content, cfg=DEFAULT_GTS_CONFIG))
+
+        with pytest.raises(Exception) as exc_info:
+            store.validate_schema(schema_id)
+        assert "dependencies/a/properties/b/x-gts-ref" in str(exc_info.value)
+
     def test_validate_schema_not_found(self):
         """Test validating non-existent schema."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         with pytest.raises(StoreGtsSchemaNotFound):
@@ -283,24 +500,97 @@ class TestGtsStoreValidation:
 
     def test_validate_schema_not_type_id(self):
         """Test validating with non-type ID."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         with pytest.raises(ValueError) as exc_info:
             store.validate_schema("gts.vendor.package.namespace.type.v1~instance")
         assert "not a schema" in str(exc_info.value)
 
-    def test_validate_instance_valid(self):
+    @pytest.mark.benchmark
+    def test_validate_instance_valid(self, schema_and_instance_store):
         """Test validating a valid instance."""
-        store = self._create_store_with_schema_and_instance()
+        store = schema_and_instance_store
         # Should not raise
         store.validate_instance(
             "gts.vendor.package.namespace.type.v1~vendor.package.namespace.inst.v1"
         )
 
+    def test_validate_instance_after_schema_reregistered(self):
+        """Test that re-registering a schema replaces its cached validator."""
+        store = _create_store_with_schema_and_instance()
+        instance_id = (
+            "gts.vendor.package.namespace.type.v1~vendor.package.namespace.inst.v1"
+        )
+        store.validate_instance(instance_id)
+
+        store.register_schema(
+            "gts.vendor.package.namespace.type.v1~",
+            {
+                "type": "object",
+                "properties": {"name": {"type": "integer"}},
+            },
+        )
+        with pytest.raises(Exception) as exc_info:
+            store.validate_instance(instance_id)
+        assert "is not of type 'integer'" in str(exc_info.value)
+
+    def test_get_compiled_validator_reused_until_reregister(self):
+        """Test the compiled validator is built once per schema registration."""
+        store = _create_store_with_schema_and_instance()
+        schema_id = "gts.vendor.package.namespace.type.v1~"
+
+        validator = store.get_compiled_validator(schema_id)
+        assert store.get_compiled_validator(schema_id) is validator
+        assert validator.is_valid({"name": "x"})
+        assert not validator.is_valid({})
+
+        store.register_schema(schema_id, {"type": "object"})
+        assert store.get_compiled_validator(schema_id) is not validator
+        assert store.get_compiled_validator(schema_id).is_valid({})
+
+        with pytest.raises(StoreGtsSchemaNotFound):
+            store.get_compiled_validator("gts.vendor.package.namespace.none.v1~")
+
+    def test_validate_instances(self):
+        """Test validating several instances in one call."""
+        store = _create_store_with_schema_and_instance()
+        store.register(
+            GtsEntity(
+                content={
+                    "$id": "gts.vendor.package.namespace.type.v1~vendor.package.namespace.bad.v1",
+                    "gtsType": "gts.vendor.package.namespace.type.v1~",
+                    "name": 42,
+                },
+                cfg=DEFAULT_GTS_CONFIG,
+            )
+        )
+        missing = (
+            "gts.vendor.package.namespace.type.v1~vendor.package.namespace.none.v1"
+        )
+
+        errors = store.validate_instances(
+            [
+                "gts.vendor.package.namespace.type.v1~vendor.package.namespace.inst.v1",
+                "gts.vendor.package.namespace.type.v1~vendor.package.namespace.bad.v1",
+                missing,
+            ]
+        )
+        assert list(errors) == [
+            "gts.vendor.package.namespace.type.v1~vendor.package.namespace.bad.v1",
+            missing,
+        ]
+        assert (
+            "is not of type 'string'"
+            in errors[
+                "gts.vendor.package.namespace.type.v1~vendor.package.namespace.bad.v1"
+            ]
+        )
+        assert "not found" in errors[missing]
+
     def test_validate_instance_not_found(self):
         """Test validating non-existent instance."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         with pytest.raises(StoreGtsObjectNotFound):
@@ -309,6 +599,33 @@ class TestGtsStoreValidation:
             )
 
 
+class TestGtsStoreCompatibility:
+    """Tests for is_minor_compatible."""
+
+    def test_compatibility_recomputed_after_reregister(self):
+        """Test that re-registering a schema invalidates cached compatibility."""
+        store = GtsStore(EMPTY_READER)
+        old_id = "gts.vendor.package.namespace.type.v1.0~"
+        new_id = "gts.vendor.package.namespace.type.v1.1~"
+        base = {"type": "object", "properties": {"name": {"type": "string"}}}
+        store.register_schema(old_id, base)
+        store.register_schema(new_id, base)
+
+        assert store.is_minor_compatible(old_id, new_id).is_backward_compatible
+
+        store.register_schema(
+            new_id,
+            {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+                "required": ["age"],
+            },
+        )
+        result = store.is_minor_compatible(old_id, new_id)
+        assert not result.is_backward_compatible
+        assert result.backward_errors
+
+
 class TestGtsStoreBuildGraph:
     """Tests for build_schema_graph method."""
 
@@ -329,9 +646,76 @@ class TestGtsStoreBuildGraph:
         graph = store.build_schema_graph("gts.vendor.package.namespace.type.v1~")
         assert graph["id"] == "gts.vendor.package.namespace.type.v1~"
 
+    def test_build_graph_sees_new_refs_after_register(self):
+        """Test that a cached graph is rebuilt after an entity is registered."""
+        type_id = "gts.vendor.package.namespace.type.v1~"
+        schema = GtsEntity(
+            content={
+                "$id": type_id,
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+            },
+            cfg=DEFAULT_GTS_CONFIG,
+        )
+        store = GtsStore(MockGtsReader([schema]))
+
+        graph = store.build_schema_graph(type_id)
+        graph["id"] = "mutated"
+        assert store.build_schema_graph(type_id) == {"id": type_id}
+
+        store.register(
+            GtsEntity(
+                content={
+                    "$id": type_id,
+                    "$schema": "http://json-schema.org/draft-07/schema#",
+                    "type": "object",
+                    "properties": {
+                        "ref": {"$ref": "gts://gts.vendor.package.namespace.other.v1~"}
+                    },
+                },
+                cfg=DEFAULT_GTS_CONFIG,
+            )
+        )
+        graph = store.build_schema_graph(type_id)
+        assert "refs" in graph
+
+    def test_build_graph_cache_kept_for_unrelated_register(self):
+        """Test registering an entity outside a cached graph keeps that graph."""
+
+        class CountingStore(GtsStore):
+            def __init__(self, reader):
+                super().__init__(reader)
+                self.gets = []
+
+            def get(self, entity_id):
+                self.gets.append(entity_id)
+                return super().get(entity_id)
+
+        type_id = "gts.vendor.package.namespace.type.v1~"
+        other_id = "gts.vendor.package.namespace.other.v1~"
+        store = CountingStore(EMPTY_READER)
+        store.register_schema(type_id, {"type": "object"})
+        store.register_schema(other_id, {"type": "object"})
+        type_graph = store.build_schema_graph(type_id)
+        store.build_schema_graph(other_id)
+
+        store.register_schema(
+            other_id,
+            {"type": "object", "properties": {"kind": {"const": type_id}}},
+        )
+        store.gets.clear()
+
+        # The unrelated graph is served without walking the store again ...
+        assert store.build_schema_graph(type_id) == type_graph
+        assert store.gets == []
+        # ... while the re-registered schema's graph reflects its new content
+        other_graph = store.build_schema_graph(other_id)
+        assert other_id in store.gets
+        assert other_graph["refs"]["properties.kind.const"]["id"] == type_id
+
     def test_build_graph_not_found(self):
         """Test building graph for non-existent entity."""
-        reader = MockGtsReader([])
+        reader = EMPTY_READER
         store = GtsStore(reader)
 
         graph = store.build_schema_graph("gts.vendor.package.namespace.nonexistent.v1~")
@@ -342,28 +726,20 @@ class TestGtsStoreBuildGraph:
 class TestStoreExceptions:
     """Tests for store exception classes."""
 
-    def test_store_gts_object_not_found(self):
-        """Test StoreGtsObjectNotFound exception."""
-        exc = StoreGtsObjectNotFound("gts.test~")
-        assert "gts.test~" in str(exc)
-        assert exc.entity_id == "gts.test~"
-
-    def test_store_gts_schema_not_found(self):
-        """Test StoreGtsSchemaNotFound exception."""
-        exc = StoreGtsSchemaNotFound("gts.test~")
-        assert "gts.test~" in str(exc)
-        assert exc.entity_id == "gts.test~"
-
-    def test_store_gts_entity_not_found(self):
-        """Test StoreGtsEntityNotFound exception."""
-        exc = StoreGtsEntityNotFound("gts.test~")
-        assert "gts.test~" in str(exc)
-        assert exc.entity_id == "gts.test~"
-
-    def test_store_gts_schema_for_instance_not_found(self):
-        """Test StoreGtsSchemaForInstanceNotFound exception."""
-        exc = StoreGtsSchemaForInstanceNotFound("gts.test~instance")
-        assert "gts.test~instance" in str(exc)
+    @pytest.mark.parametrize(
+        "exc_cls, entity_id",
+        [
+            (StoreGtsObjectNotFound, "gts.test~"),
+            (StoreGtsSchemaNotFound, "gts.test~"),
+            (StoreGtsEntityNotFound, "gts.test~"),
+            (StoreGtsSchemaForInstanceNotFound, "gts.test~instance"),
+        ],
+    )
+    def test_not_found_exceptions_carry_entity_id(self, exc_cls, entity_id):
+        """Test not-found exceptions keep the ID and mention it in the message."""
+        exc = exc_cls(entity_id)
+        assert entity_id in str(exc)
+        assert exc.entity_id == entity_id
 
     def test_store_gts_cast_from_schema_not_allowed(self):
         """Test StoreGtsCastFromSchemaNotAllowed exception."""
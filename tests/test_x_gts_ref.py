@@ -0,0 +1,102 @@
+"""Tests for XGtsRefValidator."""
+
+from gts.x_gts_ref import XGtsRefValidator
+
+
+SCHEMA = {
+    "$id": "gts://gts.vendor.package.namespace.type.v1~",
+    "type": "object",
+    "properties": {
+        "type_ref": {"type": "string", "x-gts-ref": "/$id"},
+        "module": {"type": "string", "x-gts-ref": "gts.x.core.modules.*"},
+        "refs": {
+            "type": "array",
+            "items": {"type": "string", "x-gts-ref": "gts.*"},
+        },
+    },
+}
+
+
+class TestXGtsRefIsValid:
+    """Tests for XGtsRefValidator.is_valid."""
+
+    def test_is_valid_accepts_matching_instance(self):
+        """Test an instance whose references all match is valid."""
+        validator = XGtsRefValidator()
+        instance = {
+            "type_ref": "gts.vendor.package.namespace.type.v1~",
+            "module": "gts.x.core.modules.mod.v1~",
+            "refs": ["gts.vendor.package.namespace.type.v1~"],
+        }
+
+        assert validator.is_valid(instance, SCHEMA) is True
+        assert validator.validate_instance(instance, SCHEMA) == []
+
+    def test_is_valid_agrees_with_validate_instance(self):
+        """Test is_valid is False exactly when validate_instance reports errors."""
+        validator = XGtsRefValidator()
+        instances = [
+            {"module": "gts.y.core.modules.mod.v1~"},
+            {"type_ref": "gts.vendor.package.namespace.other.v1~"},
+            {"refs": ["gts.vendor.package.namespace.type.v1~", "not-an-id"]},
+            {"module": 42, "refs": "gts.x.core.modules.mod.v1~"},
+        ]
+
+        for instance in instances:
+            errors = validator.validate_instance(instance, SCHEMA)
+            assert validator.is_valid(instance, SCHEMA) is (not errors)
+
+    def test_non_dict_properties_is_skipped(self):
+        """Test a schema whose "properties" is not a dict reports no ref errors."""
+        validator = XGtsRefValidator()
+        schema = {
+            "type": "object",
+            "properties": ["ref"],
+            "x-gts-ref": "gts.*",
+        }
+
+        assert validator.validate_instance({"ref": "not-an-id"}, schema) == []
+        assert validator.is_valid({"ref": "not-an-id"}, schema) is True
+
+
+class TestXGtsRefCompiledCache:
+    """Tests for reuse and invalidation of compiled schemas."""
+
+    def test_invalidate_recompiles_mutated_schema(self):
+        """Test invalidate(schema) picks up an in-place schema change."""
+        validator = XGtsRefValidator()
+        schema = {
+            "type": "object",
+            "properties": {"ref": {"type": "string", "x-gts-ref": "gts.x.*"}},
+        }
+        instance = {"ref": "gts.y.core.modules.mod.v1~"}
+        assert len(validator.validate_instance(instance, schema)) == 1
+
+        schema["properties"]["ref"]["x-gts-ref"] = "gts.y.*"
+        validator.invalidate(schema)
+
+        assert validator.validate_instance(instance, schema) == []
+
+
+class TestXGtsRefValidateBatch:
+    """Tests for XGtsRefValidator.validate_batch."""
+
+    def test_validate_batch_matches_validate_instance(self):
+        """Test batch results equal per-instance results, in order."""
+        validator = XGtsRefValidator()
+        instances = [
+            {"module": "gts.x.core.modules.mod.v1~"},
+            {"module": "gts.y.core.modules.mod.v1~"},
+            {"refs": ["not-an-id", "gts.vendor.package.namespace.type.v1~"]},
+            {"module": "gts.y.core.modules.mod.v1~"},
+        ]
+
+        batch = validator.validate_batch(instances, SCHEMA)
+
+        assert len(batch) == len(instances)
+        for errors, instance in zip(batch, instances):
+            expected = validator.validate_instance(instance, SCHEMA)
+            assert [(e.field_path, e.reason) for e in errors] == [
+                (e.field_path, e.reason) for e in expected
+            ]
+        assert [len(errors) for errors in batch] == [0, 1, 1, 1]